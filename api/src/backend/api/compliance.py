@@ -8,6 +8,7 @@ from prowler.lib.check.models import CheckMetadata
 PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE = {}
 PROWLER_CHECKS = {}
 AVAILABLE_COMPLIANCE_FRAMEWORKS = {}
+PROWLER_COMPLIANCE_BULK = {}
 
 
 def get_compliance_frameworks(provider_type: Provider.ProviderChoices) -> list[str]:
@@ -70,6 +71,31 @@ def get_prowler_provider_compliance(provider_type: Provider.ProviderChoices) ->
     return Compliance.get_bulk(provider_type)
 
 
+def get_compliance_bulk(provider_type: Provider.ProviderChoices) -> MappingProxyType:
+    """
+    Retrieve and cache the compliance frameworks specification for a specific cloud provider.
+
+    Parsing the compliance JSON files is expensive, so the result is cached per provider
+    type on first access. The cache is not warmed at startup, so processes that never
+    generate outputs, such as the web workers, do not hold it. The mapping is read-only
+    and the `Compliance` objects it holds must not be mutated.
+
+    Args:
+        provider_type (Provider.ProviderChoices): The provider type
+            (e.g., 'aws', 'azure') for which to retrieve compliance data.
+
+    Returns:
+        MappingProxyType: A read-only mapping of compliance framework names to their
+            respective Compliance objects for the specified provider.
+    """
+    if provider_type not in PROWLER_COMPLIANCE_BULK:
+        PROWLER_COMPLIANCE_BULK[provider_type] = MappingProxyType(
+            get_prowler_provider_compliance(provider_type)
+        )
+
+    return PROWLER_COMPLIANCE_BULK[provider_type]
+
+
 def load_prowler_compliance():
     """
     Load and initialize the Prowler compliance data and checks for all provider types.
@@ -1,8 +1,11 @@
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from api.compliance import (
     generate_compliance_overview_template,
     generate_scan_compliance,
+    get_compliance_bulk,
     get_prowler_provider_checks,
     get_prowler_provider_compliance,
     load_prowler_checks,
@@ -35,6 +38,24 @@ class TestCompliance:
         assert compliance_data == mock_compliance.get_bulk.return_value
         mock_compliance.get_bulk.assert_called_once_with(provider_type)
 
+    @patch.dict("api.compliance.PROWLER_COMPLIANCE_BULK", clear=True)
+    @patch("api.compliance.get_prowler_provider_compliance")
+    def test_get_compliance_bulk_is_cached(self, mock_get_prowler_provider_compliance):
+        compliance_data = {"compliance1": MagicMock()}
+        mock_get_prowler_provider_compliance.return_value = compliance_data
+
+        first = get_compliance_bulk(Provider.ProviderChoices.AWS)
+        second = get_compliance_bulk(Provider.ProviderChoices.AWS)
+
+        assert first is second
+        assert first == compliance_data
+        with pytest.raises(TypeError):
+            first["compliance2"] = MagicMock()
+        mock_get_prowler_provider_compliance.assert_called_once_with(
+            Provider.ProviderChoices.AWS
+        )
+
+    @patch.dict("api.compliance.PROWLER_COMPLIANCE_BULK", clear=True)
     @patch("api.models.Provider.ProviderChoices")
     @patch("api.compliance.get_prowler_provider_compliance")
     @patch("api.compliance.generate_compliance_overview_template")
@@ -69,7 +90,11 @@ class TestCompliance:
 
         load_prowler_compliance()
 
-        from api.compliance import PROWLER_CHECKS, PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE
+        from api.compliance import (
+            PROWLER_CHECKS,
+            PROWLER_COMPLIANCE_BULK,
+            PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE,
+        )
 
         assert PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE == {
             "template_key": "template_value"
@@ -83,6 +108,8 @@ class TestCompliance:
             expected_prowler_compliance
         )
         mock_load_prowler_checks.assert_called_once_with(expected_prowler_compliance)
+        # The frameworks cache is only filled where outputs are generated
+        assert PROWLER_COMPLIANCE_BULK == {}
 
     @patch("api.compliance.get_prowler_provider_checks")
     @patch("api.models.Provider.ProviderChoices")
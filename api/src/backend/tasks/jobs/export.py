@@ -1,10 +1,17 @@
 import os
 import re
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 import config.django.base as base
-from botocore.exceptions import ClientError, NoCredentialsError, ParamValidationError
+from boto3.exceptions import S3UploadFailedError
+from botocore.exceptions import (
+    BotoCoreError,
+    ClientError,
+    NoCredentialsError,
+    ParamValidationError,
+)
 from celery.utils.log import get_task_logger
 from django.conf import settings
 
@@ -155,21 +162,19 @@ OUTPUT_FORMATS_MAPPING = {
 }
 
 
-def _compress_output_files(output_directory: str) -> str:
+def _write_output_files_zip(output_directory: str, zip_file) -> None:
     """
-    Compress output files from all configured output formats into a ZIP archive.
+    Write the output files of a scan into a ZIP archive.
     Args:
         output_directory (str): The directory where the output files are located.
-            The function looks up all known suffixes in OUTPUT_FORMATS_MAPPING
-            and compresses those files into a single ZIP.
-    Returns:
-        str: The full path to the newly created ZIP archive.
+            Every file under its parent directory is added, except the local archive.
+        zip_file (str | BinaryIO): Path or writable binary stream for the archive.
+            Streams do not need to be seekable.
     """
-    zip_path = f"{output_directory}.zip"
     parent_dir = os.path.dirname(output_directory)
-    zip_path_abs = os.path.abspath(zip_path)
+    zip_path_abs = os.path.abspath(f"{output_directory}.zip")
 
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+    with zipfile.ZipFile(zip_file, "w", zipfile.ZIP_DEFLATED) as zipf:
         for foldername, _, filenames in os.walk(parent_dir):
             for filename in filenames:
                 file_path = os.path.join(foldername, filename)
@@ -178,9 +183,81 @@ def _compress_output_files(output_directory: str) -> str:
                 arcname = os.path.relpath(file_path, start=parent_dir)
                 zipf.write(file_path, arcname)
 
+
+def _write_output_files_zip_to_pipe(output_directory: str, write_fd: int) -> None:
+    """
+    Write the output files ZIP archive into the write end of a pipe, closing it when done.
+    """
+    with os.fdopen(write_fd, "wb") as pipe:
+        _write_output_files_zip(output_directory, pipe)
+
+
+def _compress_output_files(output_directory: str) -> str:
+    """
+    Compress output files from all configured output formats into a ZIP archive.
+    Args:
+        output_directory (str): The directory where the output files are located.
+            The function looks up all known suffixes in OUTPUT_FORMATS_MAPPING
+            and compresses those files into a single ZIP.
+    Returns:
+        str: The full path to the newly created ZIP archive.
+    """
+    zip_path = f"{output_directory}.zip"
+    _write_output_files_zip(output_directory, zip_path)
     return zip_path
 
 
+def _stream_output_files_to_s3(
+    tenant_id: str, scan_id: str, output_directory: str
+) -> str | None:
+    """
+    Compress the output files straight into an S3 multipart upload.
+
+    The ZIP archive is written into a pipe by a helper thread while boto3 uploads
+    from the other end, so the archive is never written to local disk.
+
+    Args:
+        tenant_id (str): The tenant identifier used as the first segment of the S3 key.
+        scan_id (str): The scan identifier used as the second segment of the S3 key.
+        output_directory (str): The directory where the output files are located.
+
+    Returns:
+        str | None: S3 URI of the uploaded archive, or None if no bucket is configured
+            or the upload failed.
+    """
+    bucket = base.DJANGO_OUTPUT_S3_AWS_OUTPUT_BUCKET
+    if not bucket:
+        return
+
+    s3_key = f"{tenant_id}/{scan_id}/{os.path.basename(output_directory)}.zip"
+    try:
+        s3 = get_s3_client()
+
+        read_fd, write_fd = os.pipe()
+        # On exit the reader is closed before waiting for the writer, so a failed
+        # upload makes the writer stop with a broken pipe instead of blocking
+        with (
+            ThreadPoolExecutor(max_workers=1) as executor,
+            os.fdopen(read_fd, "rb") as reader,
+        ):
+            zip_future = executor.submit(
+                _write_output_files_zip_to_pipe, output_directory, write_fd
+            )
+            s3.upload_fileobj(Fileobj=reader, Bucket=bucket, Key=s3_key)
+
+        try:
+            zip_future.result()
+        except OSError as e:
+            # The upload got a truncated archive, remove it
+            logger.error(f"Output files compression failed: {str(e)}")
+            s3.delete_object(Bucket=bucket, Key=s3_key)
+            return
+
+        return f"s3://{bucket}/{s3_key}"
+    except (BotoCoreError, ClientError, S3UploadFailedError, ValueError) as e:
+        logger.error(f"S3 upload failed: {str(e)}")
+
+
 def get_s3_client():
     """
     Create and return a boto3 S3 client using AWS credentials from environment variables.
@@ -1,12 +1,18 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from shutil import rmtree
 
 from celery import chain, group, shared_task
 from celery.utils.log import get_task_logger
-from config.celery import RLSTask
-from config.django.base import DJANGO_FINDINGS_BATCH_SIZE, DJANGO_TMP_OUTPUT_DIRECTORY
+from config.celery import BROKER_VISIBILITY_TIMEOUT, RLSTask
+from config.django.base import (
+    DJANGO_FINDINGS_BATCH_SIZE,
+    DJANGO_OUTPUT_WRITER_THREADS,
+    DJANGO_TMP_OUTPUT_DIRECTORY,
+)
+from django.db.models import Prefetch
 from django_celery_beat.models import PeriodicTask
 from tasks.jobs.backfill import (
     backfill_compliance_summaries,
@@ -27,6 +33,7 @@ from tasks.jobs.export import (
     OUTPUT_FORMATS_MAPPING,
     _compress_output_files,
     _generate_output_directory,
+    _stream_output_files_to_s3,
     _upload_to_s3,
 )
 from tasks.jobs.integrations import (
@@ -48,21 +55,40 @@ from tasks.jobs.scan import (
     perform_prowler_scan,
     update_provider_compliance_scores,
 )
-from tasks.utils import batched, get_next_execution_datetime
+from tasks.utils import acquire_task_lock, batched_by_key, get_next_execution_datetime
 
-from api.compliance import get_compliance_frameworks
+from api.compliance import get_compliance_bulk, get_compliance_frameworks
 from api.db_router import READ_REPLICA_ALIAS
 from api.db_utils import rls_transaction
 from api.decorators import handle_provider_deletion, set_tenant
-from api.models import Finding, Integration, Provider, Scan, ScanSummary, StateChoices
+from api.models import (
+    Finding,
+    Integration,
+    Provider,
+    Resource,
+    Scan,
+    ScanSummary,
+    StateChoices,
+)
 from api.utils import initialize_prowler_provider
 from api.v1.serializers import ScanTaskSerializer
-from prowler.lib.check.compliance_models import Compliance
 from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
 from prowler.lib.outputs.finding import Finding as FindingOutput
 
 logger = get_task_logger(__name__)
 
+# Finding columns read by `FindingOutput.transform_api_finding`. Accessing any other
+# column on a finding fetched with `.only()` would trigger one query per row.
+FINDING_OUTPUT_FIELDS = (
+    "id",
+    "uid",
+    "status",
+    "status_extended",
+    "muted",
+    "check_metadata",
+    "compliance",
+)
+
 
 def _cleanup_orphan_scheduled_scans(
     tenant_id: str,
@@ -116,6 +142,103 @@ def _cleanup_orphan_scheduled_scans(
     return 0
 
 
+def _write_findings_batch(writer, findings, is_last, *transform_args, **write_kwargs):
+    """
+    Stream a batch of findings through an already opened output writer.
+
+    Args:
+        writer (Output | ComplianceOutput): The writer, created once per scan.
+        findings (list[FindingOutput]): The transformed findings of the batch.
+        is_last (bool): Whether this is the last batch, so the writer closes its file.
+        *transform_args: Extra arguments for `writer.transform` (compliance writers).
+        **write_kwargs: Extra arguments for `writer.batch_write_data_to_file`.
+    """
+    writer.close_file = is_last
+    writer.transform(findings, *transform_args)
+    writer.batch_write_data_to_file(**write_kwargs)
+    writer._data.clear()
+
+
+def _resolve_compliance_class(provider_type: str, name: str):
+    """
+    Resolve the compliance output class of a framework.
+
+    Args:
+        provider_type (str): The provider type, e.g. "aws".
+        name (str): The compliance framework name, e.g. "cis_2.0_aws".
+
+    Returns:
+        type[ComplianceOutput]: The matching class from `COMPLIANCE_CLASS_MAP`,
+            or `GenericCompliance` if none matches.
+    """
+    for condition, cls in COMPLIANCE_CLASS_MAP.get(provider_type, []):
+        if condition(name):
+            return cls
+    return GenericCompliance
+
+
+def _dispatch_integrations(tenant_id: str, provider_id: str, scan_id: str = None):
+    """
+    Launch the tasks of all configured integrations for a provider, if any.
+
+    Args:
+        tenant_id (str): The tenant identifier
+        provider_id (str): The provider identifier
+        scan_id (str, optional): The scan identifier for integrations that need scan data
+
+    Returns:
+        dict: The number of integration tasks launched.
+    """
+    logger.info(f"Checking integrations for provider {provider_id}")
+
+    try:
+        integration_tasks = []
+        with rls_transaction(tenant_id):
+            integrations = Integration.objects.filter(
+                integrationproviderrelationship__provider_id=provider_id,
+                enabled=True,
+            )
+
+            if not integrations.exists():
+                logger.info(f"No integrations configured for provider {provider_id}")
+                return {"integrations_processed": 0}
+
+            # Security Hub integration
+            security_hub_integrations = integrations.filter(
+                integration_type=Integration.IntegrationChoices.AWS_SECURITY_HUB
+            )
+            if security_hub_integrations.exists():
+                integration_tasks.append(
+                    security_hub_integration_task.s(
+                        tenant_id=tenant_id, provider_id=provider_id, scan_id=scan_id
+                    )
+                )
+
+        # TODO: Add other integration types here
+        # slack_integrations = integrations.filter(
+        #     integration_type=Integration.IntegrationChoices.SLACK
+        # )
+        # if slack_integrations.exists():
+        #     integration_tasks.append(
+        #        slack_integration_task.s(
+        #            tenant_id=tenant_id,
+        #            provider_id=provider_id,
+        #        )
+        #     )
+
+    except Exception as e:
+        logger.error(f"Integration check failed for provider {provider_id}: {str(e)}")
+        return {"integrations_processed": 0, "error": str(e)}
+
+    # Execute all integration tasks in parallel if any were found
+    if integration_tasks:
+        job = group(integration_tasks)
+        job.apply_async()
+        logger.info(f"Launched {len(integration_tasks)} integration task(s)")
+
+    return {"integrations_processed": len(integration_tasks)}
+
+
 def _perform_scan_complete_tasks(tenant_id: str, scan_id: str, provider_id: str):
     """
     Helper function to perform tasks after a scan is completed.
@@ -125,15 +248,25 @@ def _perform_scan_complete_tasks(tenant_id: str, scan_id: str, provider_id: str)
         scan_id (str): The ID of the scan that was performed.
         provider_id (str): The primary key of the Provider instance that was scanned.
     """
-    chain(
-        create_compliance_requirements_task.si(tenant_id=tenant_id, scan_id=scan_id),
-        update_provider_compliance_scores_task.si(tenant_id=tenant_id, scan_id=scan_id),
-    ).apply_async()
     aggregate_attack_surface_task.apply_async(
         kwargs={"tenant_id": tenant_id, "scan_id": scan_id}
     )
+    compliance_requirements = create_compliance_requirements_task.si(
+        tenant_id=tenant_id, scan_id=scan_id
+    )
+    # The compliance scores are a callback rather than part of the chord header,
+    # so a failure there does not hold back the outputs
+    compliance_requirements.link(
+        update_provider_compliance_scores_task.si(tenant_id=tenant_id, scan_id=scan_id)
+    )
+    # The compliance requirements and the scan summary are independent, so they
+    # run in parallel; as the group is followed by more tasks, Celery turns it
+    # into a chord and the outputs only start once both of them are done
     chain(
-        perform_scan_summary_task.si(tenant_id=tenant_id, scan_id=scan_id),
+        group(
+            compliance_requirements,
+            perform_scan_summary_task.si(tenant_id=tenant_id, scan_id=scan_id),
+        ),
         group(
             aggregate_daily_severity_task.si(tenant_id=tenant_id, scan_id=scan_id),
             generate_outputs_task.si(
@@ -145,10 +278,11 @@ def _perform_scan_complete_tasks(tenant_id: str, scan_id: str, provider_id: str)
             generate_compliance_reports_task.si(
                 tenant_id=tenant_id, scan_id=scan_id, provider_id=provider_id
             ),
+            # Integrations need the outputs and the scan summary, so they are looked
+            # up at the end of the workflow; the integration tasks are only sent if
+            # the provider has any
             check_integrations_task.si(
-                tenant_id=tenant_id,
-                provider_id=provider_id,
-                scan_id=scan_id,
+                tenant_id=tenant_id, provider_id=provider_id, scan_id=scan_id
             ),
         ),
     ).apply_async()
@@ -261,17 +395,30 @@ def perform_scheduled_scan_task(self, tenant_id: str, provider_id: str):
     """
     task_id = self.request.id
 
-    with rls_transaction(tenant_id):
-        periodic_task_instance = PeriodicTask.objects.get(
-            name=f"scan-perform-scheduled-{provider_id}"
-        )
+    # A redelivered task keeps its ID, so the lock is only held on duplicates
+    lock_acquired = acquire_task_lock(
+        f"scheduled-scan:{provider_id}:{task_id}", task_id, BROKER_VISIBILITY_TIMEOUT
+    )
 
+    with rls_transaction(tenant_id):
         executed_scan = Scan.objects.filter(
             tenant_id=tenant_id,
             provider_id=provider_id,
             task__task_runner_task__task_id=task_id,
         ).order_by("completed_at")
 
+        if lock_acquired is False:
+            # Duplicated delivery: return the scan it already started, if any,
+            # without looking up the periodic task
+            affected_scan = executed_scan.first()
+            if affected_scan:
+                logger.warning(f"Duplicated scheduled scan for provider {provider_id}.")
+                return ScanTaskSerializer(instance=affected_scan).data
+
+        periodic_task_instance = PeriodicTask.objects.get(
+            name=f"scan-perform-scheduled-{provider_id}"
+        )
+
         if (
             Scan.objects.filter(
                 tenant_id=tenant_id,
@@ -311,21 +458,32 @@ def perform_scheduled_scan_task(self, tenant_id: str, provider_id: str):
             scheduler_task_id=periodic_task_instance.id,
         )
 
-        scan_instance, _ = Scan.objects.get_or_create(
+        # Claim the oldest pending scan with a single UPDATE, or create it already
+        # linked to the task. The subquery keeps the claim to one row when several
+        # scans are pending
+        pending_scans = Scan.objects.filter(
             tenant_id=tenant_id,
             provider_id=provider_id,
             trigger=Scan.TriggerChoices.SCHEDULED,
             state__in=(StateChoices.SCHEDULED, StateChoices.AVAILABLE),
             scheduler_task_id=periodic_task_instance.id,
-            defaults={
-                "state": StateChoices.SCHEDULED,
-                "name": "Daily scheduled scan",
-                "scheduled_at": next_scan_datetime - timedelta(days=1),
-            },
+        ).order_by("inserted_at", "id")
+        claimed = Scan.objects.filter(pk__in=pending_scans.values("pk")[:1]).update(
+            task_id=task_id, updated_at=datetime.now(timezone.utc)
         )
-
-        scan_instance.task_id = task_id
-        scan_instance.save()
+        if claimed:
+            scan_instance = Scan.objects.get(tenant_id=tenant_id, task_id=task_id)
+        else:
+            scan_instance = Scan.objects.create(
+                tenant_id=tenant_id,
+                provider_id=provider_id,
+                trigger=Scan.TriggerChoices.SCHEDULED,
+                state=StateChoices.SCHEDULED,
+                name="Daily scheduled scan",
+                scheduled_at=next_scan_datetime - timedelta(days=1),
+                scheduler_task_id=periodic_task_instance.id,
+                task_id=task_id,
+            )
 
     try:
         result = perform_prowler_scan(
@@ -387,7 +545,12 @@ def generate_outputs_task(scan_id: str, provider_id: str, tenant_id: str):
         provider_id (str): The provider_id id to be used in generating outputs.
     """
     # Check if the scan has findings
-    if not ScanSummary.objects.filter(scan_id=scan_id).exists():
+    # Fetch the summaries once: they tell whether the scan has findings and feed
+    # the HTML stats. The scan is joined for its unique resource count
+    scan_summaries = list(
+        ScanSummary.objects.filter(scan_id=scan_id).select_related("scan")
+    )
+    if not scan_summaries:
         logger.info(f"No findings found for scan {scan_id}")
         return {"upload": False}
 
@@ -396,32 +559,13 @@ def generate_outputs_task(scan_id: str, provider_id: str, tenant_id: str):
     provider_uid = provider_obj.uid
     provider_type = provider_obj.provider
 
-    frameworks_bulk = Compliance.get_bulk(provider_type)
+    frameworks_bulk = get_compliance_bulk(provider_type)
     frameworks_avail = get_compliance_frameworks(provider_type)
     out_dir, comp_dir = _generate_output_directory(
         DJANGO_TMP_OUTPUT_DIRECTORY, provider_uid, tenant_id, scan_id
     )
 
-    def get_writer(writer_map, name, factory, is_last):
-        """
-        Return existing writer_map[name] or create via factory().
-        In both cases set `.close_file = is_last`.
-        """
-        initialization = False
-        if name not in writer_map:
-            writer_map[name] = factory()
-            initialization = True
-        w = writer_map[name]
-        w.close_file = is_last
-
-        return w, initialization
-
-    output_writers = {}
-    compliance_writers = {}
-
-    scan_summary = FindingOutput._transform_findings_stats(
-        ScanSummary.objects.filter(scan_id=scan_id)
-    )
+    scan_summary = FindingOutput._transform_findings_stats(scan_summaries)
 
     # Check if we need to generate ASFF output for AWS providers with SecurityHub integration
     generate_asff = False
@@ -433,81 +577,125 @@ def generate_outputs_task(scan_id: str, provider_id: str, tenant_id: str):
         )
         generate_asff = security_hub_integrations.exists()
 
+    # Writers are created once and keep their file open for the whole scan; every
+    # batch is then streamed through the same `transform` + write path
+    output_writers = []
+    for mode, cfg in OUTPUT_FORMATS_MAPPING.items():
+        # Skip ASFF generation if not needed
+        if mode == "json-asff" and not generate_asff:
+            continue
+
+        extra = cfg.get("kwargs", {}).copy()
+        if mode == "html":
+            extra.update(provider=prowler_provider, stats=scan_summary)
+
+        writer = cfg["class"](
+            findings=[],
+            file_path=out_dir,
+            file_extension=cfg["suffix"],
+            from_cli=False,
+        )
+        writer.create_file_descriptor(writer.file_path)
+        output_writers.append((writer, extra))
+
+    compliance_writers = []
+    for name in frameworks_avail:
+        compliance_obj = frameworks_bulk[name]
+        writer = _resolve_compliance_class(provider_type, name)(
+            findings=[],
+            compliance=compliance_obj,
+            file_path=f"{comp_dir}_{name}.csv",
+            from_cli=False,
+        )
+        writer.create_file_descriptor(writer.file_path)
+        # Findings reference requirements by "<Framework>-<Version>", not by file name
+        compliance_name = (
+            f"{compliance_obj.Framework}-{compliance_obj.Version}"
+            if compliance_obj.Version
+            else compliance_obj.Framework
+        )
+        # Manual requirements have no checks and no findings, so their rows are
+        # only added with the last batch
+        checked_obj = compliance_obj.copy(
+            update={
+                "Requirements": [
+                    req for req in compliance_obj.Requirements if req.Checks
+                ]
+            }
+        )
+        compliance_writers.append(
+            (writer, compliance_obj, checked_obj, compliance_name)
+        )
+
+    # `transform_api_finding` reads `finding.resources.first()` and its tags, so
+    # prefetch them per batch instead of issuing two extra queries per finding.
+    # The resources queryset must be ordered for `.first()` to hit the cache.
+    # Findings are paginated on their id, served by the (tenant_id, scan_id, id)
+    # index.
     qs = (
         Finding.all_objects.filter(tenant_id=tenant_id, scan_id=scan_id)
-        .order_by("uid")
-        .iterator()
+        .order_by("id")
+        .only(*FINDING_OUTPUT_FIELDS)
+        .prefetch_related(
+            Prefetch(
+                "resources",
+                queryset=Resource.all_objects.order_by("id").prefetch_related("tags"),
+            )
+        )
     )
-    with rls_transaction(tenant_id, using=READ_REPLICA_ALIAS):
-        for batch, is_last in batched(qs, DJANGO_FINDINGS_BATCH_SIZE):
+
+    # Every writer owns its file and buffer, so the writers of a batch are
+    # independent and can run concurrently while the batch is shared read-only.
+    # They are only awaited once the next batch has been fetched and transformed,
+    # so the writers of one batch overlap with the preparation of the next one
+    futures = []
+    with (
+        ThreadPoolExecutor(max_workers=DJANGO_OUTPUT_WRITER_THREADS) as executor,
+        rls_transaction(tenant_id, using=READ_REPLICA_ALIAS),
+    ):
+        for batch, is_last in batched_by_key(qs, DJANGO_FINDINGS_BATCH_SIZE):
             fos = [
                 FindingOutput.transform_api_finding(f, prowler_provider) for f in batch
             ]
 
-            # Outputs
-            for mode, cfg in OUTPUT_FORMATS_MAPPING.items():
-                # Skip ASFF generation if not needed
-                if mode == "json-asff" and not generate_asff:
-                    continue
-
-                cls = cfg["class"]
-                suffix = cfg["suffix"]
-                extra = cfg.get("kwargs", {}).copy()
-                if mode == "html":
-                    extra.update(provider=prowler_provider, stats=scan_summary)
-
-                writer, initialization = get_writer(
-                    output_writers,
-                    cls,
-                    lambda cls=cls, fos=fos, suffix=suffix: cls(
-                        findings=fos,
-                        file_path=out_dir,
-                        file_extension=suffix,
-                        from_cli=False,
-                    ),
+            # A writer must finish the previous batch before taking the next one;
+            # this also re-raises any writer error
+            for future in futures:
+                future.result()
+
+            futures = [
+                executor.submit(_write_findings_batch, writer, fos, is_last, **extra)
+                for writer, extra in output_writers
+            ]
+            futures.extend(
+                executor.submit(
+                    _write_findings_batch,
+                    writer,
+                    fos,
                     is_last,
+                    compliance_obj if is_last else checked_obj,
+                    compliance_name,
                 )
-                if not initialization:
-                    writer.transform(fos)
-                writer.batch_write_data_to_file(**extra)
-                writer._data.clear()
-
-            # Compliance CSVs
-            for name in frameworks_avail:
-                compliance_obj = frameworks_bulk[name]
-
-                klass = GenericCompliance
-                for condition, cls in COMPLIANCE_CLASS_MAP.get(provider_type, []):
-                    if condition(name):
-                        klass = cls
-                        break
-
-                filename = f"{comp_dir}_{name}.csv"
-
-                writer, initialization = get_writer(
-                    compliance_writers,
-                    name,
-                    lambda klass=klass, fos=fos: klass(
-                        findings=fos,
-                        compliance=compliance_obj,
-                        file_path=filename,
-                        from_cli=False,
-                    ),
-                    is_last,
+                for writer, compliance_obj, checked_obj, compliance_name in (
+                    compliance_writers
                 )
-                if not initialization:
-                    writer.transform(fos, compliance_obj, name)
-                writer.batch_write_data_to_file()
-                writer._data.clear()
-
-    compressed = _compress_output_files(out_dir)
-
-    upload_uri = _upload_to_s3(
-        tenant_id,
-        scan_id,
-        compressed,
-        os.path.basename(compressed),
-    )
+            )
+
+        for future in futures:
+            future.result()
+
+    # Compress straight into S3 when a bucket is configured; otherwise, or if that
+    # fails, fall back to a local ZIP archive
+    upload_uri = _stream_output_files_to_s3(tenant_id, scan_id, out_dir)
+    if not upload_uri:
+        compressed = _compress_output_files(out_dir)
+
+        upload_uri = _upload_to_s3(
+            tenant_id,
+            scan_id,
+            compressed,
+            os.path.basename(compressed),
+        )
 
     compliance_dir_path = Path(comp_dir).parent
     if compliance_dir_path.exists():
@@ -529,27 +717,15 @@ def generate_outputs_task(scan_id: str, provider_id: str, tenant_id: str):
         )
 
     if s3_integrations:
-        # Pass the output directory path to S3 integration task to reconstruct objects from files
-        s3_integration_task.apply_async(
-            kwargs={
-                "tenant_id": tenant_id,
-                "provider_id": provider_id,
-                "output_directory": out_dir,
-            }
-        ).get(
-            disable_sync_subtasks=False
-        )  # TODO: This synchronous execution is NOT recommended
-        # We're forced to do this because we need the files to exist before deletion occurs.
-        # Once we have the periodic file cleanup task implemented, we should:
-        # 1. Remove this .get() call and make it fully async
-        # 2. For Cloud deployments, develop a secondary approach where outputs are stored
-        #    directly in S3 and read from there, eliminating local file dependencies
+        # Upload in-process: the files must exist until the rmtree below, and
+        # waiting here on another worker would hold two worker slots per scan
+        upload_s3_integration(tenant_id, provider_id, out_dir)
 
     if upload_uri:
         # TODO: We need to create a new periodic task to delete the output files
         # This task shouldn't be responsible for deleting the output files
         try:
-            rmtree(Path(compressed).parent, ignore_errors=True)
+            rmtree(Path(out_dir).parent, ignore_errors=True)
         except Exception as e:
             logger.error(f"Error deleting output files: {e}")
         final_location, did_upload = upload_uri, True
@@ -746,54 +922,7 @@ def check_integrations_task(tenant_id: str, provider_id: str, scan_id: str = Non
         provider_id (str): The provider identifier
         scan_id (str, optional): The scan identifier for integrations that need scan data
     """
-    logger.info(f"Checking integrations for provider {provider_id}")
-
-    try:
-        integration_tasks = []
-        with rls_transaction(tenant_id):
-            integrations = Integration.objects.filter(
-                integrationproviderrelationship__provider_id=provider_id,
-                enabled=True,
-            )
-
-            if not integrations.exists():
-                logger.info(f"No integrations configured for provider {provider_id}")
-                return {"integrations_processed": 0}
-
-            # Security Hub integration
-            security_hub_integrations = integrations.filter(
-                integration_type=Integration.IntegrationChoices.AWS_SECURITY_HUB
-            )
-            if security_hub_integrations.exists():
-                integration_tasks.append(
-                    security_hub_integration_task.s(
-                        tenant_id=tenant_id, provider_id=provider_id, scan_id=scan_id
-                    )
-                )
-
-        # TODO: Add other integration types here
-        # slack_integrations = integrations.filter(
-        #     integration_type=Integration.IntegrationChoices.SLACK
-        # )
-        # if slack_integrations.exists():
-        #     integration_tasks.append(
-        #        slack_integration_task.s(
-        #            tenant_id=tenant_id,
-        #            provider_id=provider_id,
-        #        )
-        #     )
-
-    except Exception as e:
-        logger.error(f"Integration check failed for provider {provider_id}: {str(e)}")
-        return {"integrations_processed": 0, "error": str(e)}
-
-    # Execute all integration tasks in parallel if any were found
-    if integration_tasks:
-        job = group(integration_tasks)
-        job.apply_async()
-        logger.info(f"Launched {len(integration_tasks)} integration task(s)")
-
-    return {"integrations_processed": len(integration_tasks)}
+    return _dispatch_integrations(tenant_id, provider_id, scan_id)
 
 
 @shared_task(
@@ -1,3 +1,4 @@
+import io
 import os
 import uuid
 import zipfile
@@ -6,11 +7,12 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-from botocore.exceptions import ClientError
+from botocore.exceptions import ClientError, EndpointConnectionError
 from tasks.jobs.export import (
     _compress_output_files,
     _generate_compliance_output_directory,
     _generate_output_directory,
+    _stream_output_files_to_s3,
     _upload_to_s3,
     get_s3_client,
 )
@@ -88,6 +90,102 @@ class TestOutputs:
             Key="tenant-id/scan-id/outputs.zip",
         )
 
+    @patch("tasks.jobs.export.get_s3_client")
+    @patch("tasks.jobs.export.base")
+    def test_stream_output_files_to_s3_success(
+        self, mock_base, mock_get_client, tmpdir
+    ):
+        mock_base.DJANGO_OUTPUT_S3_AWS_OUTPUT_BUCKET = "test-bucket"
+
+        base_tmp = Path(str(tmpdir.mkdir("stream_success")))
+        output_dir = base_tmp / "output"
+        output_dir.mkdir()
+        (output_dir / "result.csv").write_text("data")
+        compliance_dir = base_tmp / "compliance"
+        compliance_dir.mkdir()
+        (compliance_dir / "report.csv").write_text("ok")
+
+        uploaded = io.BytesIO()
+        client_mock = MagicMock()
+        client_mock.upload_fileobj.side_effect = (
+            lambda Fileobj, Bucket, Key: uploaded.write(Fileobj.read())
+        )
+        mock_get_client.return_value = client_mock
+
+        result = _stream_output_files_to_s3("tenant-id", "scan-id", str(output_dir))
+
+        assert result == "s3://test-bucket/tenant-id/scan-id/output.zip"
+        assert client_mock.upload_fileobj.call_args.kwargs["Key"] == (
+            "tenant-id/scan-id/output.zip"
+        )
+        # Nothing is written to local disk
+        assert not (base_tmp / "output.zip").exists()
+        with zipfile.ZipFile(uploaded, "r") as zipf:
+            assert set(zipf.namelist()) == {
+                "output/result.csv",
+                "compliance/report.csv",
+            }
+
+    @patch("tasks.jobs.export.get_s3_client")
+    @patch("tasks.jobs.export.base")
+    def test_stream_output_files_to_s3_missing_bucket(self, mock_base, mock_get_client):
+        mock_base.DJANGO_OUTPUT_S3_AWS_OUTPUT_BUCKET = ""
+        result = _stream_output_files_to_s3("tenant", "scan", "/tmp/fake/output")
+        assert result is None
+        mock_get_client.assert_not_called()
+
+    @patch("tasks.jobs.export.get_s3_client")
+    @patch("tasks.jobs.export.base")
+    @patch("tasks.jobs.export.logger.error")
+    def test_stream_output_files_to_s3_failure_logs_error(
+        self, mock_logger, mock_base, mock_get_client, tmpdir
+    ):
+        mock_base.DJANGO_OUTPUT_S3_AWS_OUTPUT_BUCKET = "bucket"
+
+        output_dir = Path(str(tmpdir.mkdir("stream_failure"))) / "output"
+        output_dir.mkdir()
+        (output_dir / "result.csv").write_text("data")
+
+        client_mock = MagicMock()
+        client_mock.upload_fileobj.side_effect = ClientError(
+            {"Error": {}}, "UploadPart"
+        )
+        mock_get_client.return_value = client_mock
+
+        result = _stream_output_files_to_s3("tenant", "scan", str(output_dir))
+
+        assert result is None
+        mock_logger.assert_called()
+
+    @patch("tasks.jobs.export.get_s3_client")
+    @patch("tasks.jobs.export.base")
+    @patch("tasks.jobs.export.logger.error")
+    def test_stream_output_files_to_s3_connection_error_falls_back_to_zip(
+        self, mock_logger, mock_base, mock_get_client, tmpdir
+    ):
+        mock_base.DJANGO_OUTPUT_S3_AWS_OUTPUT_BUCKET = "bucket"
+
+        output_dir = Path(str(tmpdir.mkdir("stream_connection_error"))) / "output"
+        output_dir.mkdir()
+        (output_dir / "result.csv").write_text("data")
+
+        client_mock = MagicMock()
+        client_mock.upload_fileobj.side_effect = EndpointConnectionError(
+            endpoint_url="https://bucket.s3.amazonaws.com"
+        )
+        mock_get_client.return_value = client_mock
+
+        result = _stream_output_files_to_s3("tenant", "scan", str(output_dir))
+
+        assert result is None
+        mock_logger.assert_called()
+
+        # The caller falls back to a local archive when the stream returns None
+        zip_path = _compress_output_files(str(output_dir))
+        assert Path(zip_path).is_file()
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert zipf.namelist() == ["output/result.csv"]
+
     @patch("tasks.jobs.export.get_s3_client")
     @patch("tasks.jobs.export.base")
     def test_upload_to_s3_missing_bucket(self, mock_base, mock_get_client):
@@ -1,20 +1,27 @@
+import time
 import uuid
+from datetime import datetime, timezone
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import openai
 import pytest
 from botocore.exceptions import ClientError
+from config.django.base import DJANGO_FINDINGS_BATCH_SIZE
 from django_celery_beat.models import IntervalSchedule, PeriodicTask
 from tasks.jobs.lighthouse_providers import (
     _create_bedrock_client,
     _extract_bedrock_credentials,
 )
 from tasks.tasks import (
+    FINDING_OUTPUT_FIELDS,
     _cleanup_orphan_scheduled_scans,
     _perform_scan_complete_tasks,
+    _resolve_compliance_class,
     check_integrations_task,
     check_lighthouse_provider_connection_task,
     generate_outputs_task,
+    perform_scheduled_scan_task,
     refresh_lighthouse_provider_models_task,
     s3_integration_task,
     security_hub_integration_task,
@@ -29,6 +36,20 @@ from api.models import (
 )
 
 
+def _mock_findings_queryset(mock_finding_filter, findings):
+    """
+    Make the findings queryset built by `generate_outputs_task` return `findings`.
+
+    `batched_by_key` slices the queryset, so `findings` are the rows of a single,
+    last page.
+    """
+    queryset = (
+        mock_finding_filter.return_value.order_by.return_value.only.return_value.prefetch_related.return_value
+    )
+    queryset.__getitem__.return_value = findings
+    return queryset
+
+
 @pytest.mark.django_db
 class TestExtractBedrockCredentials:
     """Unit tests for _extract_bedrock_credentials helper function."""
@@ -231,7 +252,7 @@ class TestGenerateOutputs:
 
     def test_no_findings_returns_early(self):
         with patch("tasks.tasks.ScanSummary.objects.filter") as mock_filter:
-            mock_filter.return_value.exists.return_value = False
+            mock_filter.return_value.select_related.return_value = []
 
             result = generate_outputs_task(
                 scan_id=self.scan_id,
@@ -245,7 +266,7 @@ class TestGenerateOutputs:
     @patch("tasks.tasks._upload_to_s3")
     @patch("tasks.tasks._compress_output_files")
     @patch("tasks.tasks.get_compliance_frameworks")
-    @patch("tasks.tasks.Compliance.get_bulk")
+    @patch("tasks.tasks.get_compliance_bulk")
     @patch("tasks.tasks.initialize_prowler_provider")
     @patch("tasks.tasks.Provider.objects.get")
     @patch("tasks.tasks.ScanSummary.objects.filter")
@@ -261,7 +282,10 @@ class TestGenerateOutputs:
         mock_compress,
         mock_upload,
     ):
-        mock_scan_summary_filter.return_value.exists.return_value = True
+        scan_summaries = [MagicMock()]
+        mock_scan_summary_filter.return_value.select_related.return_value = (
+            scan_summaries
+        )
 
         mock_provider = MagicMock()
         mock_provider.uid = "provider-uid"
@@ -275,17 +299,16 @@ class TestGenerateOutputs:
         mock_get_available_frameworks.return_value = ["cis"]
 
         dummy_finding = MagicMock(uid="f1")
-        mock_finding_filter.return_value.order_by.return_value.iterator.return_value = [
-            [dummy_finding],
-            True,
-        ]
+        findings_queryset = _mock_findings_queryset(
+            mock_finding_filter, [dummy_finding]
+        )
 
         mock_transformed_stats = {"some": "stats"}
         with (
             patch(
                 "tasks.tasks.FindingOutput._transform_findings_stats",
                 return_value=mock_transformed_stats,
-            ),
+            ) as mock_transform_stats,
             patch(
                 "tasks.tasks.FindingOutput.transform_api_finding",
                 return_value={"transformed": "f1"},
@@ -327,13 +350,27 @@ class TestGenerateOutputs:
             mock_scan_update.return_value.update.assert_called_once_with(
                 output_location="s3://bucket/zipped.zip"
             )
+            # The summaries are fetched once and reused for the stats
+            mock_scan_summary_filter.assert_called_once_with(scan_id=self.scan_id)
+            mock_transform_stats.assert_called_once_with(scan_summaries)
+            # Only the needed columns are loaded and resources and tags are
+            # prefetched per chunk to avoid N+1 queries
+            # Findings are paginated by id in batches
+            mock_finding_filter.return_value.order_by.assert_called_once_with("id")
+            mock_ordered = mock_finding_filter.return_value.order_by.return_value
+            mock_ordered.only.assert_called_once_with(*FINDING_OUTPUT_FIELDS)
+            mock_only = mock_ordered.only.return_value
+            mock_only.prefetch_related.assert_called_once()
+            findings_queryset.__getitem__.assert_called_once_with(
+                slice(None, DJANGO_FINDINGS_BATCH_SIZE + 1)
+            )
 
     def test_generate_outputs_fails_upload(self):
         with (
             patch("tasks.tasks.ScanSummary.objects.filter") as mock_filter,
             patch("tasks.tasks.Provider.objects.get"),
             patch("tasks.tasks.initialize_prowler_provider"),
-            patch("tasks.tasks.Compliance.get_bulk"),
+            patch("tasks.tasks.get_compliance_bulk"),
             patch("tasks.tasks.get_compliance_frameworks"),
             patch("tasks.tasks.Finding.all_objects.filter") as mock_findings,
             patch(
@@ -361,11 +398,8 @@ class TestGenerateOutputs:
             patch("tasks.tasks.Scan.all_objects.filter") as mock_scan_update,
             patch("tasks.tasks.rmtree"),
         ):
-            mock_filter.return_value.exists.return_value = True
-            mock_findings.return_value.order_by.return_value.iterator.return_value = [
-                [MagicMock()],
-                True,
-            ]
+            mock_filter.return_value.select_related.return_value = [MagicMock()]
+            _mock_findings_queryset(mock_findings, [MagicMock()])
 
             result = generate_outputs_task(
                 scan_id="scan",
@@ -376,6 +410,47 @@ class TestGenerateOutputs:
             assert result == {"upload": False}
             mock_scan_update.return_value.update.assert_called_once()
 
+    def test_generate_outputs_streams_archive_to_s3(self):
+        with (
+            patch("tasks.tasks.ScanSummary.objects.filter") as mock_filter,
+            patch("tasks.tasks.Provider.objects.get"),
+            patch("tasks.tasks.initialize_prowler_provider"),
+            patch("tasks.tasks.get_compliance_bulk"),
+            patch("tasks.tasks.get_compliance_frameworks", return_value=[]),
+            patch("tasks.tasks.Finding.all_objects.filter") as mock_findings,
+            patch(
+                "tasks.tasks._generate_output_directory",
+                return_value=("/tmp/test/out", "/tmp/test/comp"),
+            ),
+            patch("tasks.tasks.FindingOutput._transform_findings_stats"),
+            patch("tasks.tasks.FindingOutput.transform_api_finding"),
+            patch("tasks.tasks.OUTPUT_FORMATS_MAPPING", {}),
+            patch(
+                "tasks.tasks._stream_output_files_to_s3",
+                return_value="s3://bucket/out.zip",
+            ) as mock_stream,
+            patch("tasks.tasks._compress_output_files") as mock_compress,
+            patch("tasks.tasks.Scan.all_objects.filter") as mock_scan_update,
+            patch("tasks.tasks.rmtree") as mock_rmtree,
+        ):
+            mock_filter.return_value.select_related.return_value = [MagicMock()]
+            _mock_findings_queryset(mock_findings, [MagicMock()])
+
+            result = generate_outputs_task(
+                scan_id="scan",
+                provider_id=self.provider_id,
+                tenant_id=self.tenant_id,
+            )
+
+            assert result == {"upload": True}
+            mock_stream.assert_called_once_with(self.tenant_id, "scan", "/tmp/test/out")
+            # No local archive is built when the stream succeeds
+            mock_compress.assert_not_called()
+            mock_rmtree.assert_called_once_with(Path("/tmp/test"), ignore_errors=True)
+            mock_scan_update.return_value.update.assert_called_once_with(
+                output_location="s3://bucket/out.zip"
+            )
+
     def test_generate_outputs_triggers_html_extra_update(self):
         mock_finding_output = MagicMock()
         mock_finding_output.compliance = {"cis": ["requirement-1", "requirement-2"]}
@@ -403,7 +478,7 @@ class TestGenerateOutputs:
             patch("tasks.tasks.ScanSummary.objects.filter") as mock_filter,
             patch("tasks.tasks.Provider.objects.get", return_value=mock_provider),
             patch("tasks.tasks.initialize_prowler_provider"),
-            patch("tasks.tasks.Compliance.get_bulk", return_value={"cis": MagicMock()}),
+            patch("tasks.tasks.get_compliance_bulk", return_value={"cis": MagicMock()}),
             patch("tasks.tasks.get_compliance_frameworks", return_value=["cis"]),
             patch("tasks.tasks.Finding.all_objects.filter") as mock_findings,
             patch(
@@ -437,11 +512,8 @@ class TestGenerateOutputs:
                 {"aws": [(lambda x: True, mock_compliance_class)]},
             ),
         ):
-            mock_filter.return_value.exists.return_value = True
-            mock_findings.return_value.order_by.return_value.iterator.return_value = [
-                [MagicMock()],
-                True,
-            ]
+            mock_filter.return_value.select_related.return_value = [MagicMock()]
+            _mock_findings_queryset(mock_findings, [MagicMock()])
 
             generate_outputs_task(
                 scan_id=self.scan_id,
@@ -450,7 +522,7 @@ class TestGenerateOutputs:
             )
             html_writer_mock.batch_write_data_to_file.assert_called_once()
 
-    def test_transform_called_only_on_second_batch(self):
+    def test_transform_called_on_every_batch(self):
         raw1 = MagicMock()
         raw2 = MagicMock()
 
@@ -463,20 +535,26 @@ class TestGenerateOutputs:
 
         class TrackingWriter:
             def __init__(self, findings, file_path, file_extension, from_cli):
-                self.transform_called = 0
-                self.batch_write_data_to_file = MagicMock()
+                self.init_findings = findings
+                self.file_path = f"{file_path}{file_extension}"
+                self.transform_calls = []
+                self.close_file_calls = []
+                self.create_file_descriptor = MagicMock()
                 self._data = []
                 self.close_file = False
                 writer_instances.append(self)
 
             def transform(self, fos):
-                self.transform_called += 1
+                self.transform_calls.append(fos)
+
+            def batch_write_data_to_file(self):
+                self.close_file_calls.append(self.close_file)
 
         with (
             patch("tasks.tasks.ScanSummary.objects.filter") as mock_summary,
             patch("tasks.tasks.Provider.objects.get"),
             patch("tasks.tasks.initialize_prowler_provider"),
-            patch("tasks.tasks.Compliance.get_bulk"),
+            patch("tasks.tasks.get_compliance_bulk"),
             patch("tasks.tasks.get_compliance_frameworks", return_value=[]),
             patch("tasks.tasks.FindingOutput._transform_findings_stats"),
             patch(
@@ -495,14 +573,14 @@ class TestGenerateOutputs:
             patch("tasks.tasks.Scan.all_objects.filter"),
             patch("tasks.tasks.rmtree"),
             patch(
-                "tasks.tasks.batched",
+                "tasks.tasks.batched_by_key",
                 return_value=[
                     ([raw1], False),
                     ([raw2], True),
                 ],
             ),
         ):
-            mock_summary.return_value.exists.return_value = True
+            mock_summary.return_value.select_related.return_value = [MagicMock()]
 
             with patch(
                 "tasks.tasks.OUTPUT_FORMATS_MAPPING",
@@ -523,17 +601,155 @@ class TestGenerateOutputs:
         assert result == {"upload": True}
         assert len(writer_instances) == 1
         writer = writer_instances[0]
-        assert writer.transform_called == 1
+        # The writer is opened once and every batch goes through `transform`
+        assert writer.init_findings == []
+        writer.create_file_descriptor.assert_called_once_with("/tmp/test/outdir.json")
+        assert writer.transform_calls == [[tf1], [tf2]]
+        assert writer.close_file_calls == [False, True]
+
+    def test_writers_see_batches_in_order(self):
+        raw_batches = [[MagicMock()], [MagicMock(), MagicMock()], [MagicMock()]]
+        writer_instances = []
 
-    def test_compliance_transform_called_on_second_batch(self):
-        raw1 = MagicMock()
-        raw2 = MagicMock()
-        compliance_obj = MagicMock()
+        class SlowWriter:
+            def __init__(self, findings, file_path, file_extension, from_cli):
+                self.file_path = f"{file_path}{file_extension}"
+                self.create_file_descriptor = MagicMock()
+                self.batches = []
+                self._data = []
+                self.close_file = False
+                writer_instances.append(self)
+
+            def transform(self, fos):
+                self._data.extend(fos)
+
+            def batch_write_data_to_file(self):
+                # Give the next batch time to be prepared while this one is written
+                time.sleep(0.01)
+                self.batches.append((list(self._data), self.close_file))
+
+        with (
+            patch("tasks.tasks.ScanSummary.objects.filter") as mock_summary,
+            patch("tasks.tasks.Provider.objects.get"),
+            patch("tasks.tasks.initialize_prowler_provider"),
+            patch("tasks.tasks.get_compliance_bulk"),
+            patch("tasks.tasks.get_compliance_frameworks", return_value=[]),
+            patch("tasks.tasks.FindingOutput._transform_findings_stats"),
+            patch(
+                "tasks.tasks.FindingOutput.transform_api_finding",
+                side_effect=lambda f, prov: f,
+            ),
+            patch(
+                "tasks.tasks._generate_output_directory",
+                return_value=("/tmp/test/outdir", "/tmp/test/compdir"),
+            ),
+            patch("tasks.tasks._compress_output_files", return_value="outdir.zip"),
+            patch("tasks.tasks._upload_to_s3", return_value="s3://bucket/outdir.zip"),
+            patch("tasks.tasks.Scan.all_objects.filter"),
+            patch("tasks.tasks.rmtree"),
+            patch(
+                "tasks.tasks.batched_by_key",
+                return_value=[
+                    (raw_batches[0], False),
+                    (raw_batches[1], False),
+                    (raw_batches[2], True),
+                ],
+            ),
+            patch(
+                "tasks.tasks.OUTPUT_FORMATS_MAPPING",
+                {
+                    mode: {"class": SlowWriter, "suffix": suffix, "kwargs": {}}
+                    for mode, suffix in (("csv", ".csv"), ("json", ".json"))
+                },
+            ),
+        ):
+            mock_summary.return_value.select_related.return_value = [MagicMock()]
+
+            generate_outputs_task(
+                scan_id=self.scan_id,
+                provider_id=self.provider_id,
+                tenant_id=self.tenant_id,
+            )
+
+        assert len(writer_instances) == 2
+        for writer in writer_instances:
+            assert writer.batches == [
+                (raw_batches[0], False),
+                (raw_batches[1], False),
+                (raw_batches[2], True),
+            ]
+
+    def test_writer_exception_propagates(self):
+        class FailingWriter:
+            def __init__(self, findings, file_path, file_extension, from_cli):
+                self.file_path = f"{file_path}{file_extension}"
+                self.create_file_descriptor = MagicMock()
+                self._data = []
+                self.close_file = False
+
+            def transform(self, fos):
+                pass
+
+            def batch_write_data_to_file(self):
+                raise OSError("disk full")
+
+        with (
+            patch("tasks.tasks.ScanSummary.objects.filter") as mock_summary,
+            patch("tasks.tasks.Provider.objects.get"),
+            patch("tasks.tasks.initialize_prowler_provider"),
+            patch("tasks.tasks.get_compliance_bulk"),
+            patch("tasks.tasks.get_compliance_frameworks", return_value=[]),
+            patch("tasks.tasks.FindingOutput._transform_findings_stats"),
+            patch("tasks.tasks.FindingOutput.transform_api_finding"),
+            patch(
+                "tasks.tasks._generate_output_directory",
+                return_value=("/tmp/test/outdir", "/tmp/test/compdir"),
+            ),
+            patch("tasks.tasks._compress_output_files") as mock_compress,
+            patch("tasks.tasks._upload_to_s3"),
+            patch("tasks.tasks.rmtree"),
+            patch(
+                "tasks.tasks.batched_by_key",
+                return_value=[([MagicMock()], False), ([MagicMock()], True)],
+            ),
+            patch(
+                "tasks.tasks.OUTPUT_FORMATS_MAPPING",
+                {
+                    "json": {
+                        "class": FailingWriter,
+                        "suffix": ".json",
+                        "kwargs": {},
+                    }
+                },
+            ),
+        ):
+            mock_summary.return_value.select_related.return_value = [MagicMock()]
+
+            with pytest.raises(OSError, match="disk full"):
+                generate_outputs_task(
+                    scan_id=self.scan_id,
+                    provider_id=self.provider_id,
+                    tenant_id=self.tenant_id,
+                )
+
+        mock_compress.assert_not_called()
+
+    def test_compliance_transform_adds_manual_requirements_on_last_batch(self):
+        raw1 = MagicMock(compliance={"CIS-2.0": ["1.1"]})
+        raw2 = MagicMock(compliance={"CIS-2.0": ["1.2"]})
+        raw3 = MagicMock(compliance={})
+        checked_req = MagicMock(Checks=["check1"])
+        manual_req = MagicMock(Checks=[])
+        compliance_obj = MagicMock(
+            Framework="CIS", Version="2.0", Requirements=[checked_req, manual_req]
+        )
         writer_instances = []
 
         class TrackingComplianceWriter:
-            def __init__(self, *args, **kwargs):
+            def __init__(self, findings, compliance, file_path, from_cli):
+                self.file_path = file_path
                 self.transform_calls = []
+                self.create_file_descriptor = MagicMock()
                 self._data = []
                 self.close_file = False
                 writer_instances.append(self)
@@ -546,7 +762,7 @@ class TestGenerateOutputs:
                 pass
 
         two_batches = [
-            ([raw1], False),
+            ([raw1, raw3], False),
             ([raw2], True),
         ]
 
@@ -558,7 +774,7 @@ class TestGenerateOutputs:
             ),
             patch("tasks.tasks.initialize_prowler_provider"),
             patch(
-                "tasks.tasks.Compliance.get_bulk", return_value={"cis": compliance_obj}
+                "tasks.tasks.get_compliance_bulk", return_value={"cis": compliance_obj}
             ),
             patch("tasks.tasks.get_compliance_frameworks", return_value=["cis"]),
             patch(
@@ -579,7 +795,7 @@ class TestGenerateOutputs:
                 "tasks.tasks.Scan.all_objects.filter",
                 return_value=MagicMock(update=lambda **kw: None),
             ),
-            patch("tasks.tasks.batched", return_value=two_batches),
+            patch("tasks.tasks.batched_by_key", return_value=two_batches),
             patch("tasks.tasks.OUTPUT_FORMATS_MAPPING", {}),
             patch("tasks.tasks.rmtree"),
             patch(
@@ -587,7 +803,7 @@ class TestGenerateOutputs:
                 {"aws": [(lambda name: True, TrackingComplianceWriter)]},
             ),
         ):
-            mock_summary.return_value.exists.return_value = True
+            mock_summary.return_value.select_related.return_value = [MagicMock()]
 
             result = generate_outputs_task(
                 scan_id=self.scan_id,
@@ -597,7 +813,19 @@ class TestGenerateOutputs:
 
         assert len(writer_instances) == 1
         writer = writer_instances[0]
-        assert writer.transform_calls == [([raw2], compliance_obj, "cis")]
+        writer.create_file_descriptor.assert_called_once_with(
+            "/tmp/test/compdir_cis.csv"
+        )
+        # Every batch is streamed, but only the last one gets the manual
+        # requirements; findings reference them by "<Framework>-<Version>"
+        assert writer.transform_calls == [
+            ([raw1, raw3], compliance_obj.copy.return_value, "CIS-2.0"),
+            ([raw2], compliance_obj, "CIS-2.0"),
+        ]
+        compliance_obj.copy.assert_called_once_with(
+            update={"Requirements": [checked_req]}
+        )
+        assert writer.close_file is True
         assert result == {"upload": True}
 
     # TODO: We need to add a periodic task to delete old output files
@@ -628,7 +856,7 @@ class TestGenerateOutputs:
             patch("tasks.tasks.ScanSummary.objects.filter") as mock_filter,
             patch("tasks.tasks.Provider.objects.get", return_value=mock_provider),
             patch("tasks.tasks.initialize_prowler_provider"),
-            patch("tasks.tasks.Compliance.get_bulk", return_value={"cis": MagicMock()}),
+            patch("tasks.tasks.get_compliance_bulk", return_value={"cis": MagicMock()}),
             patch("tasks.tasks.get_compliance_frameworks", return_value=["cis"]),
             patch("tasks.tasks.Finding.all_objects.filter") as mock_findings,
             patch(
@@ -662,11 +890,8 @@ class TestGenerateOutputs:
                 {"aws": [(lambda x: True, mock_compliance_class)]},
             ),
         ):
-            mock_filter.return_value.exists.return_value = True
-            mock_findings.return_value.order_by.return_value.iterator.return_value = [
-                [MagicMock()],
-                True,
-            ]
+            mock_filter.return_value.select_related.return_value = [MagicMock()]
+            _mock_findings_queryset(mock_findings, [MagicMock()])
 
             with caplog.at_level("ERROR"):
                 generate_outputs_task(
@@ -686,7 +911,7 @@ class TestGenerateOutputs:
             patch("tasks.tasks.ScanSummary.objects.filter") as mock_summary,
             patch("tasks.tasks.Provider.objects.get"),
             patch("tasks.tasks.initialize_prowler_provider"),
-            patch("tasks.tasks.Compliance.get_bulk"),
+            patch("tasks.tasks.get_compliance_bulk"),
             patch("tasks.tasks.get_compliance_frameworks", return_value=[]),
             patch("tasks.tasks.Finding.all_objects.filter") as mock_findings,
             patch(
@@ -699,13 +924,10 @@ class TestGenerateOutputs:
             patch("tasks.tasks._upload_to_s3", return_value="s3://bucket/file.zip"),
             patch("tasks.tasks.Scan.all_objects.filter"),
             patch("tasks.tasks.rmtree"),
-            patch("tasks.tasks.s3_integration_task.apply_async") as mock_s3_task,
+            patch("tasks.tasks.upload_s3_integration") as mock_s3_upload,
         ):
-            mock_summary.return_value.exists.return_value = True
-            mock_findings.return_value.order_by.return_value.iterator.return_value = [
-                [MagicMock()],
-                True,
-            ]
+            mock_summary.return_value.select_related.return_value = [MagicMock()]
+            _mock_findings_queryset(mock_findings, [MagicMock()])
             mock_integration_filter.return_value = [MagicMock()]
             mock_rls.return_value.__enter__.return_value = None
 
@@ -725,11 +947,36 @@ class TestGenerateOutputs:
                 integration_type=Integration.IntegrationChoices.AMAZON_S3,
                 enabled=True,
             )
-            mock_s3_task.assert_called_once()
+            mock_s3_upload.assert_called_once_with(
+                self.tenant_id, self.provider_id, "/tmp/test/out"
+            )
+
+
+class TestResolveComplianceClass:
+    def test_returns_first_matching_class(self):
+        cis_class, fallback_class = MagicMock(), MagicMock()
+        class_map = {
+            "aws": [
+                (lambda name: name.startswith("cis_"), cis_class),
+                (lambda name: True, fallback_class),
+            ]
+        }
+        with patch("tasks.tasks.COMPLIANCE_CLASS_MAP", class_map):
+            assert _resolve_compliance_class("aws", "cis_2.0_aws") is cis_class
+            assert _resolve_compliance_class("aws", "ens_rd2022_aws") is fallback_class
+
+    def test_defaults_to_generic_compliance(self):
+        with (
+            patch("tasks.tasks.COMPLIANCE_CLASS_MAP", {"aws": []}),
+            patch("tasks.tasks.GenericCompliance") as mock_generic,
+        ):
+            assert _resolve_compliance_class("aws", "cis_2.0_aws") is mock_generic
+            assert _resolve_compliance_class("unknown", "cis_2.0_aws") is mock_generic
 
 
 class TestScanCompleteTasks:
     @patch("tasks.tasks.aggregate_attack_surface_task.apply_async")
+    @patch("tasks.tasks.group")
     @patch("tasks.tasks.chain")
     @patch("tasks.tasks.create_compliance_requirements_task.si")
     @patch("tasks.tasks.update_provider_compliance_scores_task.si")
@@ -746,17 +993,31 @@ class TestScanCompleteTasks:
         mock_update_compliance_scores_task,
         mock_compliance_requirements_task,
         mock_chain,
+        mock_group,
         mock_attack_surface_task,
     ):
         """Test that scan complete tasks are properly orchestrated with optimized reports."""
         _perform_scan_complete_tasks("tenant-id", "scan-id", "provider-id")
 
+        # Compliance requirements and scan summary run in parallel before the
+        # outputs, in a single workflow
+        assert mock_group.call_args_list[0].args == (
+            mock_compliance_requirements_task.return_value,
+            mock_scan_summary_task.return_value,
+        )
+        mock_chain.return_value.apply_async.assert_called_once()
+        # The compliance scores update is linked to the requirements, outside the
+        # chord header, so it cannot hold back the outputs
+        mock_compliance_requirements_task.return_value.link.assert_called_once_with(
+            mock_update_compliance_scores_task.return_value
+        )
+
         # Verify compliance requirements task is called via chain
         mock_compliance_requirements_task.assert_called_once_with(
             tenant_id="tenant-id", scan_id="scan-id"
         )
 
-        # Verify update provider compliance scores task is called via chain
+        # Verify update provider compliance scores task is linked
         mock_update_compliance_scores_task.assert_called_once_with(
             tenant_id="tenant-id", scan_id="scan-id"
         )
@@ -786,11 +1047,174 @@ class TestScanCompleteTasks:
             provider_id="provider-id",
         )
 
-        # Verify integrations task is called
+        # Integrations are checked at the end of the workflow, after the outputs
         mock_check_integrations_task.assert_called_once_with(
-            tenant_id="tenant-id",
-            provider_id="provider-id",
-            scan_id="scan-id",
+            tenant_id="tenant-id", provider_id="provider-id", scan_id="scan-id"
+        )
+        assert mock_group.call_args_list[-1].args == (
+            mock_compliance_reports_task.return_value,
+            mock_check_integrations_task.return_value,
+        )
+        assert mock_chain.call_args.args[-1] == mock_group.return_value
+
+
+@pytest.mark.django_db
+class TestPerformScheduledScanTask:
+    def setup_method(self):
+        self.tenant_id = str(uuid.uuid4())
+        self.provider_id = str(uuid.uuid4())
+        self.task_id = str(uuid.uuid4())
+        self.next_scan_datetime = datetime(2026, 1, 2, tzinfo=timezone.utc)
+
+    def _run_task(self, lock_acquired, executed_scan=None, pending_scan=None):
+        """
+        Run the task with its queries mocked, returning the task result and the
+        mocks. `executed_scan` is the scan already linked to the task id, and
+        `pending_scan` the SCHEDULED or AVAILABLE scan claimed by the task.
+        """
+        executed_scans = MagicMock()
+        executed_scans.first.return_value = executed_scan
+        executed_scans.exists.return_value = executed_scan is not None
+        pending_scans = MagicMock()
+        claimed_scans = MagicMock()
+        claimed_scans.update.return_value = 1 if pending_scan else 0
+        other_scans = MagicMock()
+        other_scans.exists.return_value = False
+
+        def filter_scans(**kwargs):
+            if "task__task_runner_task__task_id" in kwargs:
+                return MagicMock(order_by=MagicMock(return_value=executed_scans))
+            if "state__in" in kwargs:
+                return pending_scans
+            if "pk__in" in kwargs:
+                return claimed_scans
+            return other_scans
+
+        with (
+            patch(
+                "tasks.tasks.acquire_task_lock", return_value=lock_acquired
+            ) as mock_lock,
+            patch("tasks.tasks.rls_transaction"),
+            patch("tasks.tasks.Scan.objects") as mock_scan_objects,
+            patch("tasks.tasks.PeriodicTask.objects.get") as mock_periodic_get,
+            patch("tasks.tasks.ScanTaskSerializer") as mock_serializer,
+            patch(
+                "tasks.tasks.get_next_execution_datetime",
+                return_value=self.next_scan_datetime,
+            ),
+            patch("tasks.tasks._cleanup_orphan_scheduled_scans"),
+            patch(
+                "tasks.tasks.perform_prowler_scan", return_value={"result": "ok"}
+            ) as mock_scan,
+            patch("tasks.tasks._perform_scan_complete_tasks"),
+        ):
+            mock_scan_objects.filter.side_effect = filter_scans
+            mock_scan_objects.get.return_value = pending_scan
+            mock_periodic_get.return_value.id = 7
+            mock_serializer.return_value.data = {"id": "executed"}
+
+            result = perform_scheduled_scan_task.apply(
+                kwargs={"tenant_id": self.tenant_id, "provider_id": self.provider_id},
+                task_id=self.task_id,
+            ).get()
+
+        return result, {
+            "lock": mock_lock,
+            "periodic_get": mock_periodic_get,
+            "scan": mock_scan,
+            "scan_objects": mock_scan_objects,
+            "pending_scans": pending_scans,
+            "claimed_scans": claimed_scans,
+            "serializer": mock_serializer,
+        }
+
+    def test_duplicate_delivery_returns_executed_scan(self):
+        executed_scan = MagicMock()
+
+        result, mocks = self._run_task(False, executed_scan=executed_scan)
+
+        assert result == {"id": "executed"}
+        mocks["lock"].assert_called_once()
+        assert mocks["lock"].call_args.args[0] == (
+            f"scheduled-scan:{self.provider_id}:{self.task_id}"
+        )
+        mocks["serializer"].assert_called_once_with(instance=executed_scan)
+        mocks["periodic_get"].assert_not_called()
+        mocks["scan"].assert_not_called()
+
+    def test_duplicate_delivery_without_scan_runs_the_scan(self):
+        result, mocks = self._run_task(False, pending_scan=MagicMock())
+
+        assert result == {"result": "ok"}
+        mocks["periodic_get"].assert_called_once_with(
+            name=f"scan-perform-scheduled-{self.provider_id}"
+        )
+        mocks["scan"].assert_called_once()
+
+    def test_lock_unavailable_runs_the_scan(self):
+        # Valkey being down must not block scheduled scans
+        result, mocks = self._run_task(None, pending_scan=MagicMock())
+
+        assert result == {"result": "ok"}
+        mocks["periodic_get"].assert_called_once()
+        mocks["serializer"].assert_not_called()
+        mocks["scan"].assert_called_once()
+
+    def test_pending_scan_is_claimed(self):
+        pending_scan = MagicMock(id="pending-scan-id")
+
+        _, mocks = self._run_task(True, pending_scan=pending_scan)
+
+        claim = mocks["claimed_scans"].update.call_args.kwargs
+        assert claim["task_id"] == self.task_id
+        assert "updated_at" in claim
+        mocks["scan_objects"].get.assert_called_once_with(
+            tenant_id=self.tenant_id, task_id=self.task_id
+        )
+        mocks["scan_objects"].create.assert_not_called()
+        mocks["scan"].assert_called_once_with(
+            tenant_id=self.tenant_id,
+            scan_id="pending-scan-id",
+            provider_id=self.provider_id,
+        )
+
+    def test_claim_is_limited_to_the_oldest_pending_scan(self):
+        _, mocks = self._run_task(True, pending_scan=MagicMock())
+
+        ordered_scans = mocks["pending_scans"].order_by
+        ordered_scans.assert_called_once_with("inserted_at", "id")
+        ordered_scans.return_value.values.assert_called_once_with("pk")
+        ordered_scans.return_value.values.return_value.__getitem__.assert_called_once_with(
+            slice(None, 1)
+        )
+
+    def test_scan_is_created_when_none_is_pending(self):
+        _, mocks = self._run_task(True)
+
+        mocks["scan_objects"].get.assert_not_called()
+        mocks["scan_objects"].create.assert_called_once()
+        created_scan = mocks["scan_objects"].create.call_args.kwargs
+        assert created_scan["task_id"] == self.task_id
+        assert created_scan["state"] == StateChoices.SCHEDULED
+        assert created_scan["scheduler_task_id"] == 7
+        assert created_scan["scheduled_at"] == datetime(2026, 1, 1, tzinfo=timezone.utc)
+        mocks["scan"].assert_called_once_with(
+            tenant_id=self.tenant_id,
+            scan_id=str(mocks["scan_objects"].create.return_value.id),
+            provider_id=self.provider_id,
+        )
+
+    def test_next_scan_is_scheduled_once(self):
+        _, mocks = self._run_task(True, pending_scan=MagicMock())
+
+        mocks["scan_objects"].get_or_create.assert_called_once_with(
+            tenant_id=self.tenant_id,
+            name="Daily scheduled scan",
+            provider_id=self.provider_id,
+            trigger=Scan.TriggerChoices.SCHEDULED,
+            state=StateChoices.SCHEDULED,
+            scheduled_at=self.next_scan_datetime,
+            scheduler_task_id=7,
         )
 
 
@@ -905,12 +1329,12 @@ class TestCheckIntegrationsTask:
             enabled=True,
         )
 
-    @patch("tasks.tasks.s3_integration_task")
+    @patch("tasks.tasks.upload_s3_integration")
     @patch("tasks.tasks.Integration.objects.filter")
     @patch("tasks.tasks.ScanSummary.objects.filter")
     @patch("tasks.tasks.Provider.objects.get")
     @patch("tasks.tasks.initialize_prowler_provider")
-    @patch("tasks.tasks.Compliance.get_bulk")
+    @patch("tasks.tasks.get_compliance_bulk")
     @patch("tasks.tasks.get_compliance_frameworks")
     @patch("tasks.tasks.Finding.all_objects.filter")
     @patch("tasks.tasks._generate_output_directory")
@@ -936,13 +1360,11 @@ class TestCheckIntegrationsTask:
         mock_provider_get,
         mock_scan_summary,
         mock_integration_filter,
-        mock_s3_task,
+        mock_s3_upload,
     ):
         """Test that ASFF output is generated for AWS providers with SecurityHub integration."""
         # Setup
-        mock_scan_summary_qs = MagicMock()
-        mock_scan_summary_qs.exists.return_value = True
-        mock_scan_summary.return_value = mock_scan_summary_qs
+        mock_scan_summary.return_value.select_related.return_value = [MagicMock()]
 
         # Mock AWS provider
         mock_provider = MagicMock()
@@ -955,8 +1377,8 @@ class TestCheckIntegrationsTask:
         mock_security_hub_integrations.exists.return_value = True
         mock_integration_filter.return_value = mock_security_hub_integrations
 
-        # Mock s3_integration_task
-        mock_s3_task.apply_async.return_value.get.return_value = True
+        # Mock upload_s3_integration
+        mock_s3_upload.return_value = True
 
         # Mock other necessary components
         mock_initialize_provider.return_value = MagicMock()
@@ -967,10 +1389,7 @@ class TestCheckIntegrationsTask:
 
         # Mock findings
         mock_finding = MagicMock()
-        mock_findings.return_value.order_by.return_value.iterator.return_value = [
-            [mock_finding],
-            True,
-        ]
+        _mock_findings_queryset(mock_findings, [mock_finding])
         mock_transform_finding.return_value = MagicMock(compliance={})
 
         # Track which output formats were created
@@ -1033,12 +1452,12 @@ class TestCheckIntegrationsTask:
 
             assert result == {"upload": True}
 
-    @patch("tasks.tasks.s3_integration_task")
+    @patch("tasks.tasks.upload_s3_integration")
     @patch("tasks.tasks.Integration.objects.filter")
     @patch("tasks.tasks.ScanSummary.objects.filter")
     @patch("tasks.tasks.Provider.objects.get")
     @patch("tasks.tasks.initialize_prowler_provider")
-    @patch("tasks.tasks.Compliance.get_bulk")
+    @patch("tasks.tasks.get_compliance_bulk")
     @patch("tasks.tasks.get_compliance_frameworks")
     @patch("tasks.tasks.Finding.all_objects.filter")
     @patch("tasks.tasks._generate_output_directory")
@@ -1064,13 +1483,11 @@ class TestCheckIntegrationsTask:
         mock_provider_get,
         mock_scan_summary,
         mock_integration_filter,
-        mock_s3_task,
+        mock_s3_upload,
     ):
         """Test that ASFF output is NOT generated for AWS providers without SecurityHub integration."""
         # Setup
-        mock_scan_summary_qs = MagicMock()
-        mock_scan_summary_qs.exists.return_value = True
-        mock_scan_summary.return_value = mock_scan_summary_qs
+        mock_scan_summary.return_value.select_related.return_value = [MagicMock()]
 
         # Mock AWS provider
         mock_provider = MagicMock()
@@ -1092,10 +1509,7 @@ class TestCheckIntegrationsTask:
 
         # Mock findings
         mock_finding = MagicMock()
-        mock_findings.return_value.order_by.return_value.iterator.return_value = [
-            [mock_finding],
-            True,
-        ]
+        _mock_findings_queryset(mock_findings, [mock_finding])
         mock_transform_finding.return_value = MagicMock(compliance={})
 
         # Track which output formats were created
@@ -1161,7 +1575,7 @@ class TestCheckIntegrationsTask:
     @patch("tasks.tasks.ScanSummary.objects.filter")
     @patch("tasks.tasks.Provider.objects.get")
     @patch("tasks.tasks.initialize_prowler_provider")
-    @patch("tasks.tasks.Compliance.get_bulk")
+    @patch("tasks.tasks.get_compliance_bulk")
     @patch("tasks.tasks.get_compliance_frameworks")
     @patch("tasks.tasks.Finding.all_objects.filter")
     @patch("tasks.tasks._generate_output_directory")
@@ -1189,9 +1603,7 @@ class TestCheckIntegrationsTask:
     ):
         """Test that ASFF output is NOT generated for non-AWS providers (e.g., Azure, GCP)."""
         # Setup
-        mock_scan_summary_qs = MagicMock()
-        mock_scan_summary_qs.exists.return_value = True
-        mock_scan_summary.return_value = mock_scan_summary_qs
+        mock_scan_summary.return_value.select_related.return_value = [MagicMock()]
 
         # Mock Azure provider (non-AWS)
         mock_provider = MagicMock()
@@ -1208,10 +1620,7 @@ class TestCheckIntegrationsTask:
 
         # Mock findings
         mock_finding = MagicMock()
-        mock_findings.return_value.order_by.return_value.iterator.return_value = [
-            [mock_finding],
-            True,
-        ]
+        _mock_findings_queryset(mock_findings, [mock_finding])
         mock_transform_finding.return_value = MagicMock(compliance={})
 
         # Track which output formats were created
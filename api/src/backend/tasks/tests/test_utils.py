@@ -1,10 +1,19 @@
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
+import redis
 from django_celery_beat.models import IntervalSchedule, PeriodicTask
 from django_celery_results.models import TaskResult
-from tasks.utils import batched, get_next_execution_datetime
+from tasks.utils import (
+    VALKEY_SOCKET_TIMEOUT,
+    acquire_task_lock,
+    batched,
+    batched_by_key,
+    get_next_execution_datetime,
+    get_valkey_client,
+)
 
 
 @pytest.mark.django_db
@@ -100,3 +109,78 @@ class TestBatchedFunction:
         result = list(batched([1, 2, 3], 5))
         expected = [([1, 2, 3], True)]
         assert result == expected
+
+
+class FakeQuerySet:
+    """Minimal ordered queryset supporting slicing and `id__gt` filtering."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __getitem__(self, item):
+        return self.rows[item]
+
+    def filter(self, id__gt):
+        return FakeQuerySet([row for row in self.rows if row.id > id__gt])
+
+
+class TestBatchedByKeyFunction:
+    @staticmethod
+    def rows(count):
+        return [SimpleNamespace(id=i) for i in range(count)]
+
+    def test_inexact_batches(self):
+        rows = self.rows(5)
+        result = list(batched_by_key(FakeQuerySet(rows), 2))
+        assert result == [(rows[0:2], False), (rows[2:4], False), (rows[4:], True)]
+
+    def test_exact_batches(self):
+        rows = self.rows(4)
+        result = list(batched_by_key(FakeQuerySet(rows), 2))
+        assert result == [(rows[0:2], False), (rows[2:4], True)]
+
+    def test_empty_queryset(self):
+        assert list(batched_by_key(FakeQuerySet([]), 2)) == [([], True)]
+
+
+class TestAcquireTaskLock:
+    @patch("tasks.utils.get_valkey_client")
+    def test_lock_acquired(self, mock_get_client):
+        mock_get_client.return_value.set.return_value = True
+
+        assert acquire_task_lock("lock-key", "task-id", 60) is True
+        mock_get_client.return_value.set.assert_called_once_with(
+            "lock-key", "task-id", nx=True, ex=60
+        )
+
+    @patch("tasks.utils.get_valkey_client")
+    def test_lock_already_held(self, mock_get_client):
+        mock_get_client.return_value.set.return_value = None
+
+        assert acquire_task_lock("lock-key", "task-id", 60) is False
+
+    @patch("tasks.utils.get_valkey_client")
+    def test_valkey_unavailable(self, mock_get_client):
+        mock_get_client.return_value.set.side_effect = redis.exceptions.ConnectionError
+
+        assert acquire_task_lock("lock-key", "task-id", 60) is None
+
+    @patch("tasks.utils.get_valkey_client")
+    def test_valkey_timeout(self, mock_get_client):
+        mock_get_client.return_value.set.side_effect = redis.exceptions.TimeoutError
+
+        assert acquire_task_lock("lock-key", "task-id", 60) is None
+
+
+class TestGetValkeyClient:
+    @patch("tasks.utils._valkey_client", None)
+    @patch("tasks.utils.redis.Redis.from_url")
+    def test_client_has_timeouts_and_is_reused(self, mock_from_url, settings):
+        settings.CELERY_BROKER_URL = "redis://valkey:6379/0"
+
+        assert get_valkey_client() is get_valkey_client()
+        mock_from_url.assert_called_once_with(
+            "redis://valkey:6379/0",
+            socket_connect_timeout=VALKEY_SOCKET_TIMEOUT,
+            socket_timeout=VALKEY_SOCKET_TIMEOUT,
+        )
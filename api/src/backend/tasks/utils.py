@@ -2,9 +2,18 @@ import json
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 
+import redis
+from celery.utils.log import get_task_logger
+from django.conf import settings
 from django_celery_beat.models import PeriodicTask
 from django_celery_results.models import TaskResult
 
+logger = get_task_logger(__name__)
+
+_valkey_client = None
+# Seconds to wait on Valkey, so an unresponsive instance cannot hang the caller
+VALKEY_SOCKET_TIMEOUT = 5
+
 
 class CustomEncoder(json.JSONEncoder):
     def default(self, o):
@@ -49,6 +58,40 @@ def get_next_execution_datetime(task_id: int, provider_id: str) -> datetime:
     return current_scheduled_time + timedelta(**{interval.period: interval.every})
 
 
+def get_valkey_client() -> redis.Redis:
+    """
+    Return a client for the Valkey instance used as Celery broker, created once per process.
+    """
+    global _valkey_client
+    if _valkey_client is None:
+        _valkey_client = redis.Redis.from_url(
+            settings.CELERY_BROKER_URL,
+            socket_connect_timeout=VALKEY_SOCKET_TIMEOUT,
+            socket_timeout=VALKEY_SOCKET_TIMEOUT,
+        )
+    return _valkey_client
+
+
+def acquire_task_lock(key: str, value: str, timeout: int) -> bool | None:
+    """
+    Atomically acquire a lock in Valkey if nobody holds it yet.
+
+    Args:
+        key (str): The lock key.
+        value (str): The value stored in the lock, e.g. the task ID holding it.
+        timeout (int): Seconds after which the lock expires.
+
+    Returns:
+        bool | None: True if the lock was acquired, False if it was already held,
+            or None if Valkey could not be reached.
+    """
+    try:
+        return bool(get_valkey_client().set(key, value, nx=True, ex=timeout))
+    except redis.exceptions.RedisError as error:
+        logger.warning(f"Could not acquire lock {key}: {error}")
+        return None
+
+
 def batched(iterable, batch_size):
     """
     Yield successive batches from an iterable.
@@ -71,3 +114,32 @@ def batched(iterable, batch_size):
             batch = []
 
     yield batch, True
+
+
+def batched_by_key(queryset, batch_size, key="id"):
+    """
+    Yield successive batches of a queryset using keyset pagination.
+
+    Each batch is a separate query filtering on the last key seen, so no cursor is
+    kept open across batches and memory stays bounded by the batch size. One extra
+    row is fetched to tell the last batch apart, so unlike `batched` an empty
+    batch is only yielded for an empty queryset; writers skip empty batches and
+    would otherwise never see the last one.
+
+    Args:
+        queryset (QuerySet): The source queryset, already ordered by `key`.
+        batch_size (int): The number of rows per batch.
+        key (str): A unique field to paginate on; the queryset must be ordered by it.
+
+    Yields:
+        tuple: A pair (batch, is_last_batch).
+    """
+    page = queryset
+    while True:
+        rows = list(page[: batch_size + 1])
+        batch = rows[:batch_size]
+        is_last_batch = len(rows) <= batch_size
+        yield batch, is_last_batch
+        if is_last_batch:
+            return
+        page = queryset.filter(**{f"{key}__gt": getattr(batch[-1], key)})
@@ -126,7 +126,7 @@ class ASFF(Output):
         """
         Writes the findings data to a file in JSON ASFF format.
 
-        This method iterates over the findings data stored in the '_data' attribute and writes it to the file descriptor '_file_descriptor' in JSON format. It starts by writing the JSON opening/header '[', then iterates over each finding, dumping it to the file with an indent of 4 spaces. After writing all findings, it writes the closing ']' to complete the JSON array structure. Finally, it closes the file descriptor.
+        This method iterates over the findings data stored in the '_data' attribute and writes it to the file descriptor '_file_descriptor' in JSON format. It writes the JSON opening/header '[' if the file is empty, then iterates over each finding, dumping it to the file with an indent of 4 spaces. On the last batch (or always from the CLI), it writes the closing ']' to complete the JSON array structure and closes the file descriptor.
 
         Returns:
             None
@@ -135,22 +135,25 @@ class ASFF(Output):
             if (
                 getattr(self, "_file_descriptor", None)
                 and not self._file_descriptor.closed
-                and self._data
             ):
-                # Write JSON opening/header [
-                self._file_descriptor.write("[")
-
-                # Write findings
-                for finding in self._data:
-                    dump(
-                        finding.dict(exclude_none=True),
-                        self._file_descriptor,
-                        indent=4,
-                    )
-                    self._file_descriptor.write(",")
+                if self._data:
+                    # Write JSON opening/header [ only once, the API writes in batches
+                    if self._file_descriptor.tell() == 0:
+                        self._file_descriptor.write("[")
+
+                    # Write findings
+                    for finding in self._data:
+                        dump(
+                            finding.dict(exclude_none=True),
+                            self._file_descriptor,
+                            indent=4,
+                        )
+                        self._file_descriptor.write(",")
 
-                # Write footer/closing ]
-                if self._file_descriptor.tell() > 0:
+                # The last batch may have no findings left after the transform, but
+                # the array opened by a previous batch still has to be closed
+                if (self.close_file or self._from_cli) and self._file_descriptor.tell():
+                    # Write footer/closing ]
                     if self._file_descriptor.tell() != 1:
                         self._file_descriptor.seek(
                             self._file_descriptor.tell() - 1, SEEK_SET
@@ -158,8 +161,8 @@ class ASFF(Output):
                     self._file_descriptor.truncate()
                     self._file_descriptor.write("]")
 
-                # Close file descriptor
-                self._file_descriptor.close()
+                    # Close file descriptor
+                    self._file_descriptor.close()
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -34,24 +34,31 @@ class AzureCIS(ComplianceOutput):
         Returns:
             - None
         """
+        requirements_by_id = {
+            requirement.Id: requirement for requirement in compliance.Requirements
+        }
+        assessment_date = str(timestamp)
         for finding in findings:
             # Get the compliance requirements for the finding
-            finding_requirements = finding.compliance.get(compliance_name, [])
-            for requirement in compliance.Requirements:
-                if requirement.Id in finding_requirements:
+            for requirement_id in dict.fromkeys(
+                finding.compliance.get(compliance_name) or ()
+            ):
+                requirement = requirements_by_id.get(requirement_id)
+                if requirement:
                     for attribute in requirement.Attributes:
-                        compliance_row = AzureCISModel(
+                        # `construct` skips validation, so enums are passed by value
+                        compliance_row = AzureCISModel.construct(
                             Provider=finding.provider,
                             Description=compliance.Description,
                             SubscriptionId=finding.account_uid,
                             Location=finding.region,
-                            AssessmentDate=str(timestamp),
+                            AssessmentDate=assessment_date,
                             Requirements_Id=requirement.Id,
                             Requirements_Description=requirement.Description,
                             Requirements_Attributes_Section=attribute.Section,
                             Requirements_Attributes_SubSection=attribute.SubSection,
-                            Requirements_Attributes_Profile=attribute.Profile,
-                            Requirements_Attributes_AssessmentStatus=attribute.AssessmentStatus,
+                            Requirements_Attributes_Profile=attribute.Profile.value,
+                            Requirements_Attributes_AssessmentStatus=attribute.AssessmentStatus.value,
                             Requirements_Attributes_Description=attribute.Description,
                             Requirements_Attributes_RationaleStatement=attribute.RationaleStatement,
                             Requirements_Attributes_ImpactStatement=attribute.ImpactStatement,
@@ -60,7 +67,7 @@ class AzureCIS(ComplianceOutput):
                             Requirements_Attributes_AdditionalInformation=attribute.AdditionalInformation,
                             Requirements_Attributes_DefaultValue=attribute.DefaultValue,
                             Requirements_Attributes_References=attribute.References,
-                            Status=finding.status,
+                            Status=finding.status.value,
                             StatusExtended=finding.status_extended,
                             ResourceId=finding.resource_uid,
                             ResourceName=finding.resource_name,
@@ -71,21 +78,32 @@ class AzureCIS(ComplianceOutput):
                         )
                         self._data.append(compliance_row)
         # Add manual requirements to the compliance output
+        manual_row_fields = {
+            "Provider": compliance.Provider.lower(),
+            "Description": compliance.Description,
+            "SubscriptionId": "",
+            "Location": "",
+            "AssessmentDate": assessment_date,
+            "Status": "MANUAL",
+            "StatusExtended": "Manual check",
+            "ResourceId": "manual_check",
+            "ResourceName": "Manual check",
+            "CheckId": "manual",
+            "Muted": False,
+            "Framework": compliance.Framework,
+            "Name": compliance.Name,
+        }
         for requirement in compliance.Requirements:
             if not requirement.Checks:
                 for attribute in requirement.Attributes:
-                    compliance_row = AzureCISModel(
-                        Provider=compliance.Provider.lower(),
-                        Description=compliance.Description,
-                        SubscriptionId="",
-                        Location="",
-                        AssessmentDate=str(timestamp),
+                    compliance_row = AzureCISModel.construct(
+                        **manual_row_fields,
                         Requirements_Id=requirement.Id,
                         Requirements_Description=requirement.Description,
                         Requirements_Attributes_Section=attribute.Section,
                         Requirements_Attributes_SubSection=attribute.SubSection,
-                        Requirements_Attributes_Profile=attribute.Profile,
-                        Requirements_Attributes_AssessmentStatus=attribute.AssessmentStatus,
+                        Requirements_Attributes_Profile=attribute.Profile.value,
+                        Requirements_Attributes_AssessmentStatus=attribute.AssessmentStatus.value,
                         Requirements_Attributes_Description=attribute.Description,
                         Requirements_Attributes_RationaleStatement=attribute.RationaleStatement,
                         Requirements_Attributes_ImpactStatement=attribute.ImpactStatement,
@@ -94,13 +112,5 @@ class AzureCIS(ComplianceOutput):
                         Requirements_Attributes_AdditionalInformation=attribute.AdditionalInformation,
                         Requirements_Attributes_DefaultValue=attribute.DefaultValue,
                         Requirements_Attributes_References=attribute.References,
-                        Status="MANUAL",
-                        StatusExtended="Manual check",
-                        ResourceId="manual_check",
-                        ResourceName="Manual check",
-                        CheckId="manual",
-                        Muted=False,
-                        Framework=compliance.Framework,
-                        Name=compliance.Name,
                     )
                     self._data.append(compliance_row)
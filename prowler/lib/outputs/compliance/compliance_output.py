@@ -1,4 +1,4 @@
-from csv import DictWriter
+from csv import writer
 from pathlib import Path
 from typing import List
 
@@ -74,17 +74,14 @@ class ComplianceOutput(Output):
                 and not self._file_descriptor.closed
                 and self._data
             ):
-                csv_writer = DictWriter(
-                    self._file_descriptor,
-                    fieldnames=[field.upper() for field in self._data[0].dict().keys()],
-                    delimiter=";",
-                )
+                csv_writer = writer(self._file_descriptor, delimiter=";")
                 if self._file_descriptor.tell() == 0:
-                    csv_writer.writeheader()
-                for finding in self._data:
                     csv_writer.writerow(
-                        {k.upper(): v for k, v in finding.dict().items()}
+                        [field.upper() for field in self._data[0].dict().keys()]
                     )
+                # Every row has the fields of the same model in the same order, so
+                # their values are written as-is in a single call
+                csv_writer.writerows(finding.dict().values() for finding in self._data)
                 if self.close_file or self._from_cli:
                     self._file_descriptor.close()
         except Exception as error:
@@ -36,63 +36,84 @@ class ProwlerThreatScoreM365(ComplianceOutput):
         Returns:
             - None
         """
+        requirements_by_id = {}
+        manual_attributes = []
+        for requirement in compliance.Requirements:
+            requirements_by_id[requirement.Id] = requirement
+            if not requirement.Checks:
+                manual_attributes.extend(
+                    (requirement, attribute) for attribute in requirement.Attributes
+                )
+        assessment_date = str(timestamp)
+        append_row = self._data.append
         for finding in findings:
             # Get the compliance requirements for the finding
-            finding_requirements = finding.compliance.get(compliance_name, [])
-            for requirement in compliance.Requirements:
-                if requirement.Id in finding_requirements:
+            requirement_ids = dict.fromkeys(
+                finding.compliance.get(compliance_name) or ()
+            )
+            if not requirement_ids:
+                continue
+            finding_row_fields = {
+                "Provider": finding.provider,
+                "Description": compliance.Description,
+                "TenantId": finding.account_uid,
+                "Location": finding.region,
+                "AssessmentDate": assessment_date,
+                "Status": finding.status.value,
+                "StatusExtended": finding.status_extended,
+                "ResourceId": finding.resource_uid,
+                "ResourceName": finding.resource_name,
+                "CheckId": finding.check_id,
+                "Muted": finding.muted,
+                "Framework": compliance.Framework,
+                "Name": compliance.Name,
+            }
+            for requirement_id in requirement_ids:
+                requirement = requirements_by_id.get(requirement_id)
+                if requirement:
                     for attribute in requirement.Attributes:
-                        compliance_row = ProwlerThreatScoreM365Model(
-                            Provider=finding.provider,
-                            Description=compliance.Description,
-                            TenantId=finding.account_uid,
-                            Location=finding.region,
-                            AssessmentDate=str(timestamp),
-                            Requirements_Id=requirement.Id,
-                            Requirements_Description=requirement.Description,
-                            Requirements_Attributes_Title=attribute.Title,
-                            Requirements_Attributes_Section=attribute.Section,
-                            Requirements_Attributes_SubSection=attribute.SubSection,
-                            Requirements_Attributes_AttributeDescription=attribute.AttributeDescription,
-                            Requirements_Attributes_AdditionalInformation=attribute.AdditionalInformation,
-                            Requirements_Attributes_LevelOfRisk=attribute.LevelOfRisk,
-                            Requirements_Attributes_Weight=attribute.Weight,
-                            Status=finding.status,
-                            StatusExtended=finding.status_extended,
-                            ResourceId=finding.resource_uid,
-                            ResourceName=finding.resource_name,
-                            CheckId=finding.check_id,
-                            Muted=finding.muted,
-                            Framework=compliance.Framework,
-                            Name=compliance.Name,
+                        append_row(
+                            ProwlerThreatScoreM365Model.construct(
+                                **finding_row_fields,
+                                Requirements_Id=requirement.Id,
+                                Requirements_Description=requirement.Description,
+                                Requirements_Attributes_Title=attribute.Title,
+                                Requirements_Attributes_Section=attribute.Section,
+                                Requirements_Attributes_SubSection=attribute.SubSection,
+                                Requirements_Attributes_AttributeDescription=attribute.AttributeDescription,
+                                Requirements_Attributes_AdditionalInformation=attribute.AdditionalInformation,
+                                Requirements_Attributes_LevelOfRisk=attribute.LevelOfRisk,
+                                Requirements_Attributes_Weight=attribute.Weight,
+                            )
                         )
-                        self._data.append(compliance_row)
         # Add manual requirements to the compliance output
-        for requirement in compliance.Requirements:
-            if not requirement.Checks:
-                for attribute in requirement.Attributes:
-                    compliance_row = ProwlerThreatScoreM365Model(
-                        Provider=compliance.Provider.lower(),
-                        Description=compliance.Description,
-                        TenantId="",
-                        Location="",
-                        AssessmentDate=str(timestamp),
-                        Requirements_Id=requirement.Id,
-                        Requirements_Description=requirement.Description,
-                        Requirements_Attributes_Title=attribute.Title,
-                        Requirements_Attributes_Section=attribute.Section,
-                        Requirements_Attributes_SubSection=attribute.SubSection,
-                        Requirements_Attributes_AttributeDescription=attribute.AttributeDescription,
-                        Requirements_Attributes_AdditionalInformation=attribute.AdditionalInformation,
-                        Requirements_Attributes_LevelOfRisk=attribute.LevelOfRisk,
-                        Requirements_Attributes_Weight=attribute.Weight,
-                        Status="MANUAL",
-                        StatusExtended="Manual check",
-                        ResourceId="manual_check",
-                        ResourceName="Manual check",
-                        CheckId="manual",
-                        Muted=False,
-                        Framework=compliance.Framework,
-                        Name=compliance.Name,
-                    )
-                    self._data.append(compliance_row)
+        manual_row_fields = {
+            "Provider": compliance.Provider.lower(),
+            "Description": compliance.Description,
+            "TenantId": "",
+            "Location": "",
+            "AssessmentDate": assessment_date,
+            "Status": "MANUAL",
+            "StatusExtended": "Manual check",
+            "ResourceId": "manual_check",
+            "ResourceName": "Manual check",
+            "CheckId": "manual",
+            "Muted": False,
+            "Framework": compliance.Framework,
+            "Name": compliance.Name,
+        }
+        self._data.extend(
+            ProwlerThreatScoreM365Model.construct(
+                **manual_row_fields,
+                Requirements_Id=requirement.Id,
+                Requirements_Description=requirement.Description,
+                Requirements_Attributes_Title=attribute.Title,
+                Requirements_Attributes_Section=attribute.Section,
+                Requirements_Attributes_SubSection=attribute.SubSection,
+                Requirements_Attributes_AttributeDescription=attribute.AttributeDescription,
+                Requirements_Attributes_AdditionalInformation=attribute.AdditionalInformation,
+                Requirements_Attributes_LevelOfRisk=attribute.LevelOfRisk,
+                Requirements_Attributes_Weight=attribute.Weight,
+            )
+            for requirement, attribute in manual_attributes
+        )
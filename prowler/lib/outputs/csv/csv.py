@@ -1,4 +1,5 @@
-from csv import DictWriter
+from csv import writer
+from operator import itemgetter
 from typing import List
 
 from prowler.lib.logger import logger
@@ -96,15 +97,13 @@ class CSV(Output):
                 and not self._file_descriptor.closed
                 and self._data
             ):
-                csv_writer = DictWriter(
-                    self._file_descriptor,
-                    fieldnames=self._data[0].keys(),
-                    delimiter=";",
-                )
+                fieldnames = list(self._data[0].keys())
+                csv_writer = writer(self._file_descriptor, delimiter=";")
                 if self._file_descriptor.tell() == 0:
-                    csv_writer.writeheader()
-                for finding in self._data:
-                    csv_writer.writerow(finding)
+                    csv_writer.writerow(fieldnames)
+                # Rows are flattened by itemgetter and written in a single call,
+                # skipping the per-row dict handling of DictWriter
+                csv_writer.writerows(map(itemgetter(*fieldnames), self._data))
                 if self.close_file or self._from_cli:
                     self._file_descriptor.close()
         except Exception as error:
@@ -500,7 +500,7 @@ class Finding(BaseModel):
         further analysis.
 
         Args:
-            scan_summaries (list[dict]): A list of scan summary objects. Each object is expected
+            scan_summaries (list[dict]): A list or queryset of scan summary objects. Each object is expected
                                         to have attributes including:
                                         - _pass: Number of passed findings.
                                         - fail: Number of failed findings.
@@ -5,18 +5,23 @@ from prowler.providers.azure.services.storage.storage_client import storage_clie
 class storage_blob_public_access_level_is_disabled(Check):
     def execute(self) -> Check_Report_Azure:
         findings = []
+        metadata = self.metadata()
         for subscription, storage_accounts in storage_client.storage_accounts.items():
+            # Only the account name changes between the messages of a subscription
+            enabled_suffix = f"from subscription {subscription} has allow blob public access enabled."
+            disabled_suffix = f"from subscription {subscription} has allow blob public access disabled."
             for storage_account in storage_accounts:
-                report = Check_Report_Azure(
-                    metadata=self.metadata(), resource=storage_account
-                )
+                report = Check_Report_Azure(metadata=metadata, resource=storage_account)
                 report.subscription = subscription
-                report.status = "FAIL"
-                report.status_extended = f"Storage account {storage_account.name} from subscription {subscription} has allow blob public access enabled."
-
-                if not storage_account.allow_blob_public_access:
+                if storage_account.allow_blob_public_access:
+                    report.status = "FAIL"
+                    suffix = enabled_suffix
+                else:
                     report.status = "PASS"
-                    report.status_extended = f"Storage account {storage_account.name} from subscription {subscription} has allow blob public access disabled."
+                    suffix = disabled_suffix
+                report.status_extended = (
+                    f"Storage account {storage_account.name} {suffix}"
+                )
 
                 findings.append(report)
 
@@ -1,4 +1,4 @@
-from pydantic.v1 import BaseModel
+from dataclasses import dataclass
 
 from prowler.lib.logger import logger
 from prowler.providers.gcp.config import DEFAULT_RETRY_ATTEMPTS
@@ -11,74 +11,78 @@ class Logging(GCPService):
         super().__init__(__class__.__name__, provider, api_version="v2")
         self.sinks = []
         self.metrics = []
-        self._get_sinks()
-        self._get_metrics()
+        self.__threading_call__(self._get_sinks, self.project_ids)
+        self.__threading_call__(self._get_metrics, self.project_ids)
 
-    def _get_sinks(self):
-        for project_id in self.project_ids:
-            try:
-                request = self.client.sinks().list(parent=f"projects/{project_id}")
-                while request is not None:
-                    response = request.execute(num_retries=DEFAULT_RETRY_ATTEMPTS)
+    def _iter_pages(self, collection, project_id, items_key):
+        """Yield the items of every page listed for a project from a collection."""
+        request = collection.list(parent=f"projects/{project_id}")
+        while request is not None:
+            response = request.execute(
+                http=self.__get_AuthorizedHttp_client__(),
+                num_retries=DEFAULT_RETRY_ATTEMPTS,
+            )
+            yield from response.get(items_key, [])
+            request = collection.list_next(
+                previous_request=request, previous_response=response
+            )
 
-                    for sink in response.get("sinks", []):
-                        self.sinks.append(
-                            Sink(
-                                name=sink["name"],
-                                destination=sink["destination"],
-                                filter=sink.get("filter", "all"),
-                                project_id=project_id,
-                            )
-                        )
-
-                    request = self.client.sinks().list_next(
-                        previous_request=request, previous_response=response
+    def _get_sinks(self, project_id):
+        # Rows are gathered per project and added in one go, so each project's
+        # rows stay together although the projects are listed in parallel
+        project_sinks = []
+        try:
+            for sink in self._iter_pages(self.client.sinks(), project_id, "sinks"):
+                project_sinks.append(
+                    Sink(
+                        name=sink["name"],
+                        destination=sink["destination"],
+                        filter=sink.get("filter", "all"),
+                        project_id=project_id,
                     )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
-
-    def _get_metrics(self):
-        for project_id in self.project_ids:
-            try:
-                request = (
-                    self.client.projects()
-                    .metrics()
-                    .list(parent=f"projects/{project_id}")
                 )
-                while request is not None:
-                    response = request.execute(num_retries=DEFAULT_RETRY_ATTEMPTS)
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        self.sinks.extend(project_sinks)
 
-                    for metric in response.get("metrics", []):
-                        self.metrics.append(
-                            Metric(
-                                name=metric["name"],
-                                type=metric["metricDescriptor"]["type"],
-                                filter=metric["filter"],
-                                project_id=project_id,
-                            )
-                        )
-
-                    request = (
-                        self.client.projects()
-                        .metrics()
-                        .list_next(previous_request=request, previous_response=response)
+    def _get_metrics(self, project_id):
+        project_metrics = []
+        try:
+            for metric in self._iter_pages(
+                self.client.projects().metrics(), project_id, "metrics"
+            ):
+                project_metrics.append(
+                    Metric(
+                        name=metric["name"],
+                        type=metric["metricDescriptor"]["type"],
+                        filter=metric["filter"],
+                        project_id=project_id,
                     )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        self.metrics.extend(project_metrics)
+
 
+@dataclass
+class Sink:
+    # Declared by hand as dataclass(slots=True) needs Python 3.10
+    __slots__ = ("name", "destination", "filter", "project_id")
 
-class Sink(BaseModel):
     name: str
     destination: str
     filter: str
     project_id: str
 
 
-class Metric(BaseModel):
+@dataclass
+class Metric:
+    __slots__ = ("name", "type", "filter", "project_id")
+
     name: str
     type: str
     filter: str
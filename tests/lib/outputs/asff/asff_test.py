@@ -584,6 +584,72 @@ class TestASFF:
         content = mock_file.read()
         assert loads(content) == expected_asff
 
+    def test_asff_write_to_file_in_batches(self):
+        mock_file = StringIO()
+        first_finding = generate_finding_output(
+            status="PASS",
+            region=AWS_REGION_EU_WEST_1,
+            resource_uid="test-arn-1",
+        )
+        second_finding = generate_finding_output(
+            status="FAIL",
+            region=AWS_REGION_EU_WEST_1,
+            resource_uid="test-arn-2",
+        )
+
+        asff = ASFF(findings=[], from_cli=False)
+        asff._file_descriptor = mock_file
+
+        with patch.object(mock_file, "close", return_value=None) as mock_close:
+            asff.transform([first_finding])
+            asff.batch_write_data_to_file()
+            mock_close.assert_not_called()
+
+            asff._data.clear()
+            asff.close_file = True
+            asff.transform([second_finding])
+            asff.batch_write_data_to_file()
+            mock_close.assert_called_once()
+
+        mock_file.seek(0)
+        content = loads(mock_file.read())
+        assert [finding["Resources"][0]["Id"] for finding in content] == [
+            "test-arn-1",
+            "test-arn-2",
+        ]
+
+    def test_asff_write_to_file_closes_on_empty_last_batch(self):
+        mock_file = StringIO()
+        finding = generate_finding_output(
+            status="PASS",
+            region=AWS_REGION_EU_WEST_1,
+            resource_uid="test-arn-1",
+        )
+        manual_finding = generate_finding_output(
+            status="MANUAL",
+            region=AWS_REGION_EU_WEST_1,
+            resource_uid="test-arn-2",
+        )
+
+        asff = ASFF(findings=[], from_cli=False)
+        asff._file_descriptor = mock_file
+
+        with patch.object(mock_file, "close", return_value=None) as mock_close:
+            asff.transform([finding])
+            asff.batch_write_data_to_file()
+
+            # MANUAL findings are not exported, so the last batch is left empty
+            asff._data.clear()
+            asff.close_file = True
+            asff.transform([manual_finding])
+            assert asff._data == []
+            asff.batch_write_data_to_file()
+            mock_close.assert_called_once()
+
+        mock_file.seek(0)
+        content = loads(mock_file.read())
+        assert [finding["Resources"][0]["Id"] for finding in content] == ["test-arn-1"]
+
     def test_batch_write_data_to_file_without_findings(self):
         assert not ASFF([])._file_descriptor
 
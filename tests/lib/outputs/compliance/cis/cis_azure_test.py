@@ -20,7 +20,7 @@ class TestAzureCIS:
         findings = [
             generate_finding_output(
                 provider="azure",
-                compliance={"CIS-2.0": "2.1.3"},
+                compliance={"CIS-2.0": ["2.1.3"]},
                 account_name=AZURE_SUBSCRIPTION_NAME,
                 account_uid=AZURE_SUBSCRIPTION_ID,
                 region="",
@@ -163,6 +163,45 @@ class TestAzureCIS:
         assert output_data_manual.CheckId == "manual"
         assert output_data_manual.Muted is False
 
+    def test_output_transform_with_none_compliance(self):
+        findings = [
+            generate_finding_output(
+                provider="azure",
+                compliance={"CIS-2.0": None},
+                account_name=AZURE_SUBSCRIPTION_NAME,
+                account_uid=AZURE_SUBSCRIPTION_ID,
+                region="",
+            )
+        ]
+
+        output = AzureCIS(findings, CIS_2_0_AZURE)
+
+        # Only the manual requirement is added
+        assert [row.Requirements_Id for row in output.data] == ["2.1.4"]
+        assert output.data[0].Status == "MANUAL"
+
+    def test_output_transform_uses_plain_values(self):
+        findings = [
+            generate_finding_output(
+                provider="azure",
+                compliance={"CIS-2.0": ["2.1.3"]},
+                account_name=AZURE_SUBSCRIPTION_NAME,
+                account_uid=AZURE_SUBSCRIPTION_ID,
+                region="",
+            )
+        ]
+
+        output = AzureCIS(findings, CIS_2_0_AZURE)
+
+        # Rows are built with `construct`, so enums must already be plain values
+        for row in output.data:
+            assert type(row.Status) is str
+            assert type(row.Requirements_Attributes_Profile) is str
+            assert type(row.Requirements_Attributes_AssessmentStatus) is str
+        assert [row.Status for row in output.data] == ["PASS", "MANUAL"]
+        assert output.data[0].Requirements_Attributes_Profile == "Level 2"
+        assert output.data[0].Requirements_Attributes_AssessmentStatus == "Manual"
+
     @freeze_time("2025-01-01 00:00:00")
     @mock.patch(
         "prowler.lib.outputs.compliance.cis.cis_azure.timestamp", "2025-01-01 00:00:00"
@@ -172,7 +211,7 @@ class TestAzureCIS:
         findings = [
             generate_finding_output(
                 provider="azure",
-                compliance={"CIS-2.0": "2.1.3"},
+                compliance={"CIS-2.0": ["2.1.3"]},
                 account_name=AZURE_SUBSCRIPTION_NAME,
                 account_uid=AZURE_SUBSCRIPTION_ID,
                 region="",
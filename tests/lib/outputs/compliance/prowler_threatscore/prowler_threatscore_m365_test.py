@@ -20,7 +20,7 @@ class TestProwlerThreatScoreM365:
     def test_output_transform(self):
         findings = [
             generate_finding_output(
-                compliance={"ProwlerThreatScore-1.0": "1.1.1"},
+                compliance={"ProwlerThreatScore-1.0": ["1.1.1"]},
                 provider="m365",
                 account_name=TENANT_ID,
                 account_uid=TENANT_ID,
@@ -136,6 +136,39 @@ class TestProwlerThreatScoreM365:
         assert output_data_manual.CheckId == "manual"
         assert not output_data_manual.Muted
 
+    def test_output_transform_with_none_compliance(self):
+        findings = [
+            generate_finding_output(
+                compliance={"ProwlerThreatScore-1.0": None},
+                provider="m365",
+                account_name=TENANT_ID,
+                account_uid=TENANT_ID,
+                region="",
+            )
+        ]
+
+        output = ProwlerThreatScoreM365(findings, PROWLER_THREATSCORE_M365)
+
+        # Only the manual requirement is added
+        assert [row.Status for row in output.data] == ["MANUAL"]
+
+    def test_output_transform_uses_plain_values(self):
+        findings = [
+            generate_finding_output(
+                compliance={"ProwlerThreatScore-1.0": ["1.1.1"]},
+                provider="m365",
+                account_name=TENANT_ID,
+                account_uid=TENANT_ID,
+                region="",
+            )
+        ]
+
+        output = ProwlerThreatScoreM365(findings, PROWLER_THREATSCORE_M365)
+
+        # Rows are built with `construct`, so the status must already be a string
+        assert [type(row.Status) for row in output.data] == [str, str]
+        assert [row.Status for row in output.data] == ["PASS", "MANUAL"]
+
     @freeze_time("2025-01-01 00:00:00")
     @mock.patch(
         "prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_m365.timestamp",
@@ -145,7 +178,7 @@ class TestProwlerThreatScoreM365:
         mock_file = StringIO()
         findings = [
             generate_finding_output(
-                compliance={"ProwlerThreatScore-1.0": "1.1.1"}, provider="m365"
+                compliance={"ProwlerThreatScore-1.0": ["1.1.1"]}, provider="m365"
             )
         ]
         output = ProwlerThreatScoreM365(findings, PROWLER_THREATSCORE_M365)
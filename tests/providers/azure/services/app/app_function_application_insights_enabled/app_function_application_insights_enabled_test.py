@@ -1,116 +1,26 @@
 from unittest import mock
 from uuid import uuid4
 
+import pytest
+
 from tests.providers.azure.azure_fixtures import (
     AZURE_SUBSCRIPTION_ID,
     set_mocked_azure_provider,
 )
 
+# The checks only read the provider, so every test can share the same mock
+AZURE_PROVIDER = set_mocked_azure_provider()
 
-class Test_app_function_application_insights_enabled:
-    def test_app_no_subscriptions(self):
-        app_client = mock.MagicMock
-
-        with (
-            mock.patch(
-                "prowler.providers.common.provider.Provider.get_global_provider",
-                return_value=set_mocked_azure_provider(),
-            ),
-            mock.patch(
-                "prowler.providers.azure.services.app.app_function_application_insights_enabled.app_function_application_insights_enabled.app_client",
-                new=app_client,
-            ),
-        ):
-            from prowler.providers.azure.services.app.app_function_application_insights_enabled.app_function_application_insights_enabled import (
-                app_function_application_insights_enabled,
-            )
-
-            app_client.functions = {}
-
-            check = app_function_application_insights_enabled()
-            result = check.execute()
-            assert len(result) == 0
-
-    def test_app_subscription_empty(self):
-        app_client = mock.MagicMock
-
-        with (
-            mock.patch(
-                "prowler.providers.common.provider.Provider.get_global_provider",
-                return_value=set_mocked_azure_provider(),
-            ),
-            mock.patch(
-                "prowler.providers.azure.services.app.app_function_application_insights_enabled.app_function_application_insights_enabled.app_client",
-                new=app_client,
-            ),
-        ):
-            from prowler.providers.azure.services.app.app_function_application_insights_enabled.app_function_application_insights_enabled import (
-                app_function_application_insights_enabled,
-            )
-
-            app_client.functions = {AZURE_SUBSCRIPTION_ID: {}}
-
-            check = app_function_application_insights_enabled()
-            result = check.execute()
-            assert len(result) == 0
-
-    def test_app_function_no_app_insights(self):
-        app_client = mock.MagicMock
-
-        with (
-            mock.patch(
-                "prowler.providers.common.provider.Provider.get_global_provider",
-                return_value=set_mocked_azure_provider(),
-            ),
-            mock.patch(
-                "prowler.providers.azure.services.app.app_function_application_insights_enabled.app_function_application_insights_enabled.app_client",
-                new=app_client,
-            ),
-        ):
-            from prowler.providers.azure.services.app.app_function_application_insights_enabled.app_function_application_insights_enabled import (
-                app_function_application_insights_enabled,
-            )
-            from prowler.providers.azure.services.app.app_service import FunctionApp
-
-            function_id = str(uuid4())
-
-            app_client.functions = {
-                AZURE_SUBSCRIPTION_ID: {
-                    function_id: FunctionApp(
-                        id=function_id,
-                        name="function1",
-                        location="West Europe",
-                        kind="functionapp,linux",
-                        function_keys={},
-                        enviroment_variables={},
-                        identity=None,
-                        public_access=False,
-                        vnet_subnet_id=None,
-                        ftps_state="AllAllowed",
-                    )
-                }
-            }
-
-            check = app_function_application_insights_enabled()
-            result = check.execute()
-            assert len(result) == 1
-            assert result[0].status == "FAIL"
-            assert (
-                result[0].status_extended
-                == "Function function1 is not using Application Insights."
-            )
-            assert result[0].resource_id == function_id
-            assert result[0].resource_name == "function1"
-            assert result[0].subscription == AZURE_SUBSCRIPTION_ID
-            assert result[0].location == "West Europe"
 
-    def test_app_function_using_app_insights(self):
-        app_client = mock.MagicMock
+class Test_app_function_application_insights_enabled:
+    @pytest.fixture(autouse=True)
+    def app_client(self):
+        app_client = mock.MagicMock()
 
         with (
             mock.patch(
                 "prowler.providers.common.provider.Provider.get_global_provider",
-                return_value=set_mocked_azure_provider(),
+                return_value=AZURE_PROVIDER,
             ),
             mock.patch(
                 "prowler.providers.azure.services.app.app_function_application_insights_enabled.app_function_application_insights_enabled.app_client",
@@ -120,136 +30,87 @@ class Test_app_function_application_insights_enabled:
             from prowler.providers.azure.services.app.app_function_application_insights_enabled.app_function_application_insights_enabled import (
                 app_function_application_insights_enabled,
             )
-            from prowler.providers.azure.services.app.app_service import FunctionApp
-
-            function_id = str(uuid4())
 
-            app_client.functions = {
-                AZURE_SUBSCRIPTION_ID: {
-                    function_id: FunctionApp(
-                        id=function_id,
-                        name="function1",
-                        location="West Europe",
-                        kind="functionapp,linux",
-                        function_keys={},
-                        enviroment_variables={"APPINSIGHTS_INSTRUMENTATIONKEY": "1234"},
-                        identity=None,
-                        public_access=False,
-                        vnet_subnet_id=None,
-                        ftps_state="AllAllowed",
-                    )
-                }
-            }
-
-            check = app_function_application_insights_enabled()
-            result = check.execute()
-            assert len(result) == 1
-            assert result[0].status == "PASS"
-            assert (
-                result[0].status_extended
-                == "Function function1 is using Application Insights."
-            )
-            assert result[0].resource_id == function_id
-            assert result[0].resource_name == "function1"
-            assert result[0].subscription == AZURE_SUBSCRIPTION_ID
-            assert result[0].location == "West Europe"
-
-    def test_app_function_using_app_insights_different_key(self):
-        app_client = mock.MagicMock
-
-        with (
-            mock.patch(
-                "prowler.providers.common.provider.Provider.get_global_provider",
-                return_value=set_mocked_azure_provider(),
+            self.check_class = app_function_application_insights_enabled
+            yield app_client
+
+    @pytest.mark.parametrize(
+        "functions",
+        [{}, {AZURE_SUBSCRIPTION_ID: {}}],
+        ids=["no_subscriptions", "subscription_empty"],
+    )
+    def test_app_no_functions(self, app_client, functions):
+        app_client.functions = functions
+
+        check = self.check_class()
+        result = check.execute()
+        assert len(result) == 0
+
+    @pytest.mark.parametrize(
+        "enviroment_variables,expected_status,expected_status_extended",
+        [
+            (
+                {},
+                "FAIL",
+                "Function function1 is not using Application Insights.",
             ),
-            mock.patch(
-                "prowler.providers.azure.services.app.app_function_application_insights_enabled.app_function_application_insights_enabled.app_client",
-                new=app_client,
+            (
+                {"FUNCTIONS_WORKER_RUNTIME": "python"},
+                "FAIL",
+                "Function function1 is not using Application Insights.",
             ),
-        ):
-            from prowler.providers.azure.services.app.app_function_application_insights_enabled.app_function_application_insights_enabled import (
-                app_function_application_insights_enabled,
-            )
-            from prowler.providers.azure.services.app.app_service import FunctionApp
-
-            function_id = str(uuid4())
-
-            app_client.functions = {
-                AZURE_SUBSCRIPTION_ID: {
-                    function_id: FunctionApp(
-                        id=function_id,
-                        name="function1",
-                        location="West Europe",
-                        kind="functionapp,linux",
-                        function_keys={},
-                        enviroment_variables={"APPINSIGHTS_INSTRUMENTATIONKEY": "1234"},
-                        identity=None,
-                        public_access=False,
-                        vnet_subnet_id=None,
-                        ftps_state="AllAllowed",
-                    )
-                }
-            }
-
-            check = app_function_application_insights_enabled()
-            result = check.execute()
-            assert len(result) == 1
-            assert result[0].status == "PASS"
-            assert (
-                result[0].status_extended
-                == "Function function1 is using Application Insights."
-            )
-            assert result[0].resource_id == function_id
-            assert result[0].resource_name == "function1"
-            assert result[0].subscription == AZURE_SUBSCRIPTION_ID
-            assert result[0].location == "West Europe"
-
-    def test_app_function_with_app_insights_no_key(self):
-        app_client = mock.MagicMock
-
-        with (
-            mock.patch(
-                "prowler.providers.common.provider.Provider.get_global_provider",
-                return_value=set_mocked_azure_provider(),
+            (
+                {"APPINSIGHTS_INSTRUMENTATIONKEY": "1234"},
+                "PASS",
+                "Function function1 is using Application Insights.",
             ),
-            mock.patch(
-                "prowler.providers.azure.services.app.app_function_application_insights_enabled.app_function_application_insights_enabled.app_client",
-                new=app_client,
+            (
+                {"APPLICATIONINSIGHTS_CONNECTION_STRING": "InstrumentationKey=1234"},
+                "PASS",
+                "Function function1 is using Application Insights.",
             ),
-        ):
-            from prowler.providers.azure.services.app.app_function_application_insights_enabled.app_function_application_insights_enabled import (
-                app_function_application_insights_enabled,
-            )
-            from prowler.providers.azure.services.app.app_service import FunctionApp
-
-            function_id = str(uuid4())
-
-            app_client.functions = {
-                AZURE_SUBSCRIPTION_ID: {
-                    function_id: FunctionApp(
-                        id=function_id,
-                        name="function1",
-                        location="West Europe",
-                        kind="functionapp,linux",
-                        function_keys={},
-                        enviroment_variables={},
-                        identity=None,
-                        public_access=False,
-                        vnet_subnet_id=None,
-                        ftps_state="AllAllowed",
-                    )
-                }
+        ],
+        ids=[
+            "no_app_insights",
+            "with_app_insights_no_key",
+            "using_app_insights",
+            "using_app_insights_different_key",
+        ],
+    )
+    def test_app_function(
+        self,
+        app_client,
+        enviroment_variables,
+        expected_status,
+        expected_status_extended,
+    ):
+        from prowler.providers.azure.services.app.app_service import FunctionApp
+
+        function_id = str(uuid4())
+
+        app_client.functions = {
+            AZURE_SUBSCRIPTION_ID: {
+                function_id: FunctionApp(
+                    id=function_id,
+                    name="function1",
+                    location="West Europe",
+                    kind="functionapp,linux",
+                    function_keys={},
+                    enviroment_variables=enviroment_variables,
+                    identity=None,
+                    public_access=False,
+                    vnet_subnet_id=None,
+                    ftps_state="AllAllowed",
+                )
             }
-
-            check = app_function_application_insights_enabled()
-            result = check.execute()
-            assert len(result) == 1
-            assert result[0].status == "FAIL"
-            assert (
-                result[0].status_extended
-                == "Function function1 is not using Application Insights."
-            )
-            assert result[0].resource_id == function_id
-            assert result[0].resource_name == "function1"
-            assert result[0].subscription == AZURE_SUBSCRIPTION_ID
-            assert result[0].location == "West Europe"
+        }
+
+        check = self.check_class()
+        result = check.execute()
+        assert len(result) == 1
+        assert result[0].status == expected_status
+        assert result[0].status_extended == expected_status_extended
+        assert result[0].resource_id == function_id
+        assert result[0].resource_name == "function1"
+        assert result[0].subscription == AZURE_SUBSCRIPTION_ID
+        assert result[0].location == "West Europe"